@@ -4,11 +4,7 @@ import logging
 import os
 import pathlib
 import platform
-import re
 
-from src.models import SnedBot
-
-DOTENV_REGEX = re.compile(r"^(?P<identifier>[A-Za-z_]+[A-Za-z0-9_]*)=(?P<value>[^#]+)(#.*)?$")
 BASE_DIR = str(pathlib.Path(os.path.abspath(__file__)).parents[1])
 
 if int(platform.python_version_tuple()[1]) < 10:
@@ -17,11 +13,15 @@ if int(platform.python_version_tuple()[1]) < 10:
 
 try:
     with open(os.path.join(BASE_DIR, ".env")) as env:
-        for line in env.readlines():
-            match = DOTENV_REGEX.match(line)
-            if not match:
+        env_vars: dict[str, str] = {}
+        for line in env:
+            identifier, sep, rest = line.partition("=")
+            value = rest.partition("#")[0].strip()
+            if not sep or not identifier.isidentifier():
                 continue
-            os.environ[match.group("identifier")] = match.group("value").strip()
+            env_vars[identifier] = value
+
+        os.environ.update(env_vars)
 
 except FileNotFoundError:
     logging.info(".env file not found, using secrets from the environment instead.")
@@ -44,6 +44,9 @@ if os.name != "nt":  # Lol imagine using Windows
             "Failed to import uvloop! Make sure to install it via 'pip install uvloop' for enhanced performance!"
         )
 
+# Import the bot only once the config is known to load, so a missing config fails fast
+from src.models import SnedBot  # noqa: E402
+
 bot = SnedBot(Config())
 
 if __name__ == "__main__":
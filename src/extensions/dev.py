@@ -363,6 +363,11 @@ async def restore_db(ctx: SnedPrefixContext) -> None:
 
     else:
         await ctx.app.db.update_schema()
+
+        if userlog := ctx.app.get_plugin("Logging"):
+            userlog.d.actions.clear_all_log_caches()
+
+        ctx.app.clear_blacklist_cache()
         await ctx.app.db_cache.start()
         ctx.app.scheduler.restart()
         await ctx.respond("📥 Restored database from backup file.")
@@ -389,6 +394,7 @@ async def blacklist_cmd(ctx: SnedPrefixContext, mode: str, user: hikari.User) ->
 
         await ctx.app.db.execute("""INSERT INTO blacklist (user_id) VALUES ($1)""", user.id)
         await ctx.app.db_cache.refresh(table="blacklist", user_id=user.id)
+        ctx.app.invalidate_blacklist(user)
         await ctx.event.message.add_reaction("✅")
         await ctx.respond("✅ User added to blacklist")
 
@@ -400,6 +406,7 @@ async def blacklist_cmd(ctx: SnedPrefixContext, mode: str, user: hikari.User) ->
 
         await ctx.app.db.execute("""DELETE FROM blacklist WHERE user_id = $1""", user.id)
         await ctx.app.db_cache.refresh(table="blacklist", user_id=user.id)
+        ctx.app.invalidate_blacklist(user)
         await ctx.event.message.add_reaction("✅")
         await ctx.respond("✅ User removed from blacklist")
 
@@ -432,6 +439,9 @@ async def resetsettings_cmd(ctx: SnedPrefixContext, guild_id: int) -> None:
     await ctx.app.db.wipe_guild(guild)
     await ctx.app.db_cache.wipe(guild)
 
+    if userlog := ctx.app.get_plugin("Logging"):
+        userlog.d.actions.clear_log_config_cache(guild.id)
+
     await ctx.event.message.add_reaction("✅")
     await ctx.respond(f"✅ Wiped data for guild `{guild.id}`.")
 
@@ -551,15 +551,7 @@ Enabling **ephemeral responses** will show all moderation command responses in a
             return
 
         if self.value.boolean is not hikari.UNDEFINED and self.value.text == "Color logs":
-            await self.app.db.execute(
-                """INSERT INTO log_config (color, guild_id)
-                VALUES ($1, $2)
-                ON CONFLICT (guild_id) DO
-                UPDATE SET color = $1""",
-                self.value.boolean,
-                self.last_context.guild_id,
-            )
-            await self.app.db_cache.refresh(table="log_config", guild_id=self.last_context.guild_id)
+            await userlog.d.actions.set_color_enabled(self.last_context.guild_id, self.value.boolean)
             return await self.settings_logging()
 
         log_event = self.value.text
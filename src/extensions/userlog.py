@@ -3,8 +3,10 @@ from __future__ import annotations
 import asyncio
 import datetime
 import enum
+import functools
 import json
 import logging
+import operator
 import re
 import sys
 import traceback
@@ -32,11 +34,27 @@ from src.utils import helpers
 if t.TYPE_CHECKING:
     from src.models import SnedBot
 
-BOT_REASON_REGEX = re.compile(r"(?P<name>.*)\s\((?P<id>\d+)\):\s(?P<reason>.*)")
+# Matches helpers.format_reason, usernames are at most 32 characters, 37 with a legacy discriminator
+BOT_REASON_REGEX = re.compile(r"(?P<name>[^\n]{1,37}?) \((?P<id>\d+)\): (?P<reason>.*)", re.ASCII | re.DOTALL)
 TIMEOUT_REGEX = re.compile(
     r"Timed out until (?P<date>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}\+\d{2}:\d{2}) - (?P<reason>.*)"
 )
 
+ALL_PERMISSIONS: tuple[hikari.Permissions, ...] = tuple(hikari.Permissions)
+"""All permission flags, in definition order."""
+
+ANSI_COLORS = ("\x1b[1;30m", "\x1b[0;37m", "\x1b[1;31m", "\x1b[1;32m", "\x1b[0m")
+"""The gray, white, red, green & reset ANSI escape codes used in colored logs."""
+NO_COLORS = ("",) * 5
+"""Stand-ins for ANSI_COLORS when colored logs are disabled."""
+
+QUEUE_BATCH_DELAY = 2.0
+"""The time in seconds the log queue waits after being woken up before sending, to group log entries."""
+QUEUE_MAX_SIZE = 10000
+"""The maximum amount of log entries waiting to be sent. Entries beyond this are dropped."""
+JOURNAL_BATCH_DELAY = 0.25
+"""The time in seconds the journal queue waits after being woken up before writing, to batch inserts."""
+
 logger = logging.getLogger(__name__)
 
 userlog = SnedPlugin("Logging", include_datastore=True)
@@ -44,12 +62,33 @@ userlog = SnedPlugin("Logging", include_datastore=True)
 # Functions exposed to other extensions & plugins
 userlog.d.actions = lightbulb.utils.DataStore()
 
-# Mapping of channel_id: payload
-userlog.d.queue = {}
+# Queue of (log_event, embed, guild_id, file) entries waiting to be resolved & sent
+userlog.d.queue = asyncio.Queue(maxsize=QUEUE_MAX_SIZE)
+
+# Mapping of guild_id: log_event value: channel_id
+userlog.d.log_channels_cache = {}
+
+# Mapping of guild_id: is color enabled
+userlog.d.color_cache = {}
+
+# Mapping of channel_id: channel, for channels that are used as log channels
+userlog.d.log_channel_cache = {}
+
+# Mapping of channel_id: the bot's permissions in the log channel
+userlog.d.log_perms_cache = {}
+
+# Mapping of guild_id: if the bot can view the guild's audit logs
+userlog.d.audit_log_perms_cache = {}
+
+# Queue of journal entries waiting to be written to the database
+userlog.d.journal_queue = asyncio.Queue()
 
 # Queue iter task
 userlog.d._task = None
 
+# Journal queue iter task
+userlog.d._journal_task = None
+
 
 class LogEvent(enum.Enum):
     """Enum for all valid log events."""
@@ -86,8 +125,11 @@ class LogEvent(enum.Enum):
     """Logs related to new warnings, warning removals & clears"""
 
 
-# List of guilds where logging is temporarily suspended
-userlog.d.frozen_guilds = []
+# Set of guilds where logging is temporarily suspended
+userlog.d.frozen_guilds = set()
+
+# Mapping of guild_id: pending unfreeze timer
+userlog.d.unfreeze_handles = {}
 
 
 @attr.define()
@@ -116,7 +158,10 @@ class ParsedBotReason:
     @classmethod
     def from_reason(cls, reason: str | None) -> ParsedBotReason:
         """Parse a reason string and return a StripBotReason object."""
-        match = BOT_REASON_REGEX.match(str(reason))
+        if not reason or "): " not in reason:
+            return cls(reason, None)
+
+        match = BOT_REASON_REGEX.match(reason)
 
         if not match:
             return cls(reason, None)
@@ -135,6 +180,50 @@ def display_user(user: hikari.UndefinedNoneOr[hikari.PartialUser | UserLike]) ->
     return f"{user} ({user.id})"
 
 
+async def _get_log_channels(guild_id: int) -> dict[str, int | None]:
+    """Get the mapping of log_event:channel_id for a guild, this is cached per guild.
+    The returned dict must not be mutated.
+    """
+    log_channels: dict[str, int | None] | None = userlog.d.log_channels_cache.get(guild_id)
+
+    if log_channels is not None:
+        return log_channels
+
+    records = await userlog.app.db_cache.get(table="log_config", guild_id=guild_id, limit=1)
+
+    log_channels = json.loads(records[0]["log_channels"]) if records and records[0]["log_channels"] else {}
+
+    for log_event in LogEvent:
+        if log_event.value not in log_channels:
+            log_channels[log_event.value] = None
+
+    if userlog.app.db_cache.is_ready:
+        userlog.d.log_channels_cache[guild_id] = log_channels
+
+    return log_channels
+
+
+def clear_log_config_cache(guild_id: int) -> None:
+    """Discard the cached logging configuration of a guild. Call after modifying the guild's log_config."""
+    userlog.d.log_channels_cache.pop(guild_id, None)
+    userlog.d.color_cache.pop(guild_id, None)
+
+
+userlog.d.actions["clear_log_config_cache"] = clear_log_config_cache
+
+
+def clear_all_log_caches() -> None:
+    """Discard every cached logging configuration, log channel and permission. Call after replacing the database."""
+    userlog.d.log_channels_cache.clear()
+    userlog.d.color_cache.clear()
+    userlog.d.log_channel_cache.clear()
+    userlog.d.log_perms_cache.clear()
+    userlog.d.audit_log_perms_cache.clear()
+
+
+userlog.d.actions["clear_all_log_caches"] = clear_all_log_caches
+
+
 async def get_log_channel_id(log_event: LogEvent, guild_id: int) -> int | None:
     """Get the channel ID for a given log event.
 
@@ -155,29 +244,21 @@ async def get_log_channel_id(log_event: LogEvent, guild_id: int) -> int | None:
     ValueError
         If an invalid log_event is passed.
     """
-    records = await userlog.app.db_cache.get(table="log_config", guild_id=guild_id, limit=1)
+    return (await _get_log_channels(guild_id)).get(log_event.value)
 
-    log_channels = json.loads(records[0]["log_channels"]) if records and records[0]["log_channels"] else None
 
-    return log_channels.get(log_event.value) if log_channels else None
+userlog.d.actions["get_log_channel_id"] = get_log_channel_id
 
 
-userlog.d.actions["get_log_channel_id"] = get_log_channel_id
+async def _has_log_channel(guild_id: int, *log_events: LogEvent) -> bool:
+    """Check if any of the given log events have a log channel set, used to skip audit log lookups early."""
+    log_channels = await _get_log_channels(guild_id)
+    return any(log_channels.get(log_event.value) for log_event in log_events)
 
 
 async def get_log_channel_ids_view(guild_id: int) -> dict[str, int | None]:
     """Return a mapping of log_event:channel_id."""
-    records = await userlog.app.db_cache.get(table="log_config", guild_id=guild_id, limit=1)
-
-    log_channels: dict[str, int | None] = (
-        json.loads(records[0]["log_channels"]) if records and records[0]["log_channels"] else {}
-    )
-
-    for log_event in LogEvent:
-        if log_event.value not in log_channels:
-            log_channels[log_event.value] = None
-
-    return log_channels
+    return dict(await _get_log_channels(guild_id))
 
 
 userlog.d.actions["get_log_channel_ids_view"] = get_log_channel_ids_view
@@ -196,27 +277,55 @@ async def set_log_channel(log_event: LogEvent, guild_id: int, channel_id: int |
         guild_id,
     )
     await userlog.app.db_cache.refresh(table="log_config", guild_id=guild_id)
+    clear_log_config_cache(guild_id)
 
 
 userlog.d.actions["set_log_channel"] = set_log_channel
 
 
 async def is_color_enabled(guild_id: int) -> bool:
+    is_colored: bool | None = userlog.d.color_cache.get(guild_id)
+
+    if is_colored is not None:
+        return is_colored
+
     records = await userlog.app.db_cache.get(table="log_config", guild_id=guild_id, limit=1)
-    return records[0]["color"] if records else True
+    is_colored = records[0]["color"] if records else True
+
+    if userlog.app.db_cache.is_ready:
+        userlog.d.color_cache[guild_id] = is_colored
+
+    return is_colored
 
 
 userlog.d.actions["is_color_enabled"] = is_color_enabled
 
 
-async def log(
+async def set_color_enabled(guild_id: int, is_colored: bool) -> None:
+    """Sets if logs should be colored or not in the given guild."""
+    await userlog.app.db.execute(
+        """INSERT INTO log_config (color, guild_id)
+        VALUES ($1, $2)
+        ON CONFLICT (guild_id) DO
+        UPDATE SET color = $1""",
+        is_colored,
+        guild_id,
+    )
+    await userlog.app.db_cache.refresh(table="log_config", guild_id=guild_id)
+    clear_log_config_cache(guild_id)
+
+
+userlog.d.actions["set_color_enabled"] = set_color_enabled
+
+
+def log(
     log_event: LogEvent,
     log_content: hikari.Embed,
     guild_id: int,
     file: hikari.UndefinedOr[hikari.Resourceish] = hikari.UNDEFINED,
     bypass: bool = False,
 ) -> None:
-    """Log log_content into the channel assigned to log_event, if any.
+    """Queue log_content to be logged into the channel assigned to log_event, if any.
 
     Parameters
     ----------
@@ -237,97 +346,191 @@ async def log(
     if guild_id in userlog.d.frozen_guilds and not bypass:
         return
 
-    log_channel_id = await get_log_channel_id(log_event, guild_id)
-
-    if not log_channel_id:
+    # If the guild's config is cached, drop entries for events that are not logged right away
+    log_channels: dict[str, int | None] | None = userlog.d.log_channels_cache.get(guild_id)
+    if log_channels is not None and not log_channels.get(log_event.value):
         return
 
     log_content.timestamp = datetime.datetime.now(datetime.timezone.utc)
-    embed = log_content
+    try:
+        userlog.d.queue.put_nowait((log_event, log_content, guild_id, file))
+    except asyncio.QueueFull:
+        logger.warning(f"Log queue is full, dropping {log_event} log entry for guild {guild_id}.")
+
+
+userlog.d.actions["log"] = log
+
+
+async def _resolve_log_channel(log_event: LogEvent, guild_id: int) -> hikari.TextableGuildChannel | None:
+    """Resolve the channel log_event should be logged to, if any, and if the bot can send messages there."""
+    log_channel_id = await get_log_channel_id(log_event, guild_id)
+
+    if not log_channel_id:
+        return None
 
     # Check if the channel still exists or not, and lazily invalidate it if not
-    log_channel = userlog.app.cache.get_guild_channel(log_channel_id)
+    log_channel = userlog.d.log_channel_cache.get(log_channel_id) or userlog.app.cache.get_guild_channel(log_channel_id)
     if log_channel is None:
-        return await set_log_channel(log_event, guild_id, None)
+        await set_log_channel(log_event, guild_id, None)
+        return None
+    userlog.d.log_channel_cache[log_channel_id] = log_channel
     assert isinstance(log_channel, hikari.TextableGuildChannel)
     assert isinstance(log_channel, hikari.PermissibleGuildChannel)
 
-    me = userlog.app.cache.get_member(guild_id, userlog.app.user_id)
-    assert me is not None
-    perms = lightbulb.utils.permissions_in(log_channel, me)
-    if not (perms & hikari.Permissions.SEND_MESSAGES) or not (perms & hikari.Permissions.EMBED_LINKS):
-        # Do not attempt message send if we have no perms
-        return
+    perms: hikari.Permissions | None = userlog.d.log_perms_cache.get(log_channel_id)
 
-    if file:  # Embeds with attachments will be sent without grouping
-        try:
-            await log_channel.send(embed=embed, attachment=file)
-            return
-        except (hikari.ForbiddenError, hikari.HTTPError, asyncio.TimeoutError):
-            return
+    if perms is None:
+        me = userlog.app.cache.get_member(guild_id, userlog.app.user_id)
+        if me is None:
+            return None
+
+        perms = userlog.d.log_perms_cache[log_channel_id] = lightbulb.utils.permissions_in(log_channel, me)
 
-    if userlog.d.queue.get(log_channel.id) is None:
-        userlog.d.queue[log_channel.id] = []
+    if not (perms & hikari.Permissions.SEND_MESSAGES) or not (perms & hikari.Permissions.EMBED_LINKS):
+        # Do not attempt message send if we have no perms
+        return None
 
-    userlog.d.queue[log_channel.id].append(embed)
+    return log_channel
 
 
-userlog.d.actions["log"] = log
+async def _send_chunks(channel_id: int, chunks: list[list[hikari.Embed]]) -> None:
+    """Send chunks of embeds to a log channel, one message per chunk."""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        try:
+            await userlog.app.rest.create_message(channel_id, embeds=chunk)
+        except Exception as exc:
+            logger.warning(f"Failed to send log embed chunk to channel {channel_id}: {exc}")
 
 
 async def _iter_queue() -> None:
     """Iter queue and bulk-send embeds."""
     try:
         while True:
-            for channel_id, embeds in userlog.d.queue.items():
-                if not embeds:
+            pending = [await userlog.d.queue.get()]
+            # Give bursts of events some time to accumulate, so they can be grouped
+            await asyncio.sleep(QUEUE_BATCH_DELAY)
+
+            while not userlog.d.queue.empty():
+                pending.append(userlog.d.queue.get_nowait())
+
+            # Mapping of channel_id: chunks of embeds, each chunk is sent as one message
+            channel_chunks: dict[int, list[list[hikari.Embed]]] = {}
+            # Mapping of channel_id: combined length of the embeds in the channel's last chunk
+            chunk_lengths: dict[int, int] = {}
+
+            for log_event, embed, guild_id, file in pending:
+                try:
+                    log_channel = await _resolve_log_channel(log_event, guild_id)
+                except Exception as exc:
+                    logger.warning(f"Failed to resolve log channel for event {log_event} in guild {guild_id}: {exc}")
                     continue
 
-                embed_chunks: list[list[hikari.Embed]] = [[]]
-                for embed in embeds:
-                    # If combined length of all embeds is below 6000 and there are less than 10 embeds in chunk, add to chunk
-                    if (
-                        sum([embed.total_length() for embed in embed_chunks[-1]]) + embed.total_length()
-                    ) <= 6000 and len(embed_chunks[-1]) < 10:
-                        embed_chunks[-1].append(embed)
-                    # Otherwise make new chunk
-                    else:
-                        embed_chunks.append([embed])
-
-                for chunk in embed_chunks:
+                if log_channel is None:
+                    continue
+
+                if file:  # Embeds with attachments will be sent without grouping
                     try:
-                        await userlog.app.rest.create_message(channel_id, embeds=chunk)
+                        await log_channel.send(embed=embed, attachment=file)
                     except Exception as exc:
-                        logger.warning(f"Failed to send log embed chunk to channel {channel_id}: {exc}")
+                        logger.warning(f"Failed to send log embed with attachment to channel {log_channel.id}: {exc}")
+                    continue
 
-                userlog.d.queue[channel_id] = []
+                chunks = channel_chunks.setdefault(log_channel.id, [[]])
+                length = embed.total_length()
+                chunk_length = chunk_lengths.get(log_channel.id, 0)
 
-            await asyncio.sleep(10.0)
+                # If combined length of all embeds is below 6000 and there are less than 10 embeds in chunk, add to chunk
+                if chunk_length + length <= 6000 and len(chunks[-1]) < 10:
+                    chunks[-1].append(embed)
+                    chunk_lengths[log_channel.id] = chunk_length + length
+                # Otherwise make new chunk
+                else:
+                    chunks.append([embed])
+                    chunk_lengths[log_channel.id] = length
+
+            # Channels are rate-limited separately, so send to them concurrently
+            await asyncio.gather(*(_send_chunks(channel_id, chunks) for channel_id, chunks in channel_chunks.items()))
 
     except Exception as error:
         print("Encountered exception in userlog queue iteration:", error)
         traceback.print_exception(error.__class__, error, error.__traceback__, file=sys.stderr)
 
 
+def queue_journal_entry(entry: JournalEntry) -> None:
+    """Queue a new journal entry to be written to the database.
+    Entries are written in batches, so they may take a moment to appear.
+    """
+    userlog.d.journal_queue.put_nowait(entry)
+
+
+async def _iter_journal_queue() -> None:
+    """Iter journal queue and bulk-insert entries."""
+    entries: list[JournalEntry] = []
+    try:
+        while True:
+            entries.append(await userlog.d.journal_queue.get())
+            # Give bursts of entries (e.g. raids) some time to accumulate
+            await asyncio.sleep(JOURNAL_BATCH_DELAY)
+
+            while not userlog.d.journal_queue.empty():
+                entries.append(userlog.d.journal_queue.get_nowait())
+
+            await JournalEntry.insert_many(entries)
+            entries.clear()
+    finally:  # Write out everything still pending if the task is being cancelled
+        while not userlog.d.journal_queue.empty():
+            entries.append(userlog.d.journal_queue.get_nowait())
+
+        if entries:
+            await JournalEntry.insert_many(entries)
+
+
 async def freeze_logging(guild_id: int) -> None:
     """Call to temporarily suspend logging in the given guild. Useful if a log-spammy command is being executed."""
-    if guild_id not in userlog.d.frozen_guilds:
-        userlog.d.frozen_guilds.append(guild_id)
+    # Cancel any pending unfreeze, so it does not cut this freeze short
+    if handle := userlog.d.unfreeze_handles.pop(guild_id, None):
+        handle.cancel()
+
+    userlog.d.frozen_guilds.add(guild_id)
 
 
 userlog.d.actions["freeze_logging"] = freeze_logging
 
 
+def _unfreeze_now(guild_id: int) -> None:
+    userlog.d.unfreeze_handles.pop(guild_id, None)
+    userlog.d.frozen_guilds.discard(guild_id)
+
+
 async def unfreeze_logging(guild_id: int) -> None:
     """Call to stop suspending the logging in a given guild."""
-    await asyncio.sleep(5)  # For any pending actions, kinda crappy solution, but audit logs suck :/
-    if guild_id in userlog.d.frozen_guilds:
-        userlog.d.frozen_guilds.remove(guild_id)
+    if handle := userlog.d.unfreeze_handles.pop(guild_id, None):
+        handle.cancel()
+
+    # Delay for any pending actions, kinda crappy solution, but audit logs suck :/
+    userlog.d.unfreeze_handles[guild_id] = asyncio.get_running_loop().call_later(5.0, _unfreeze_now, guild_id)
 
 
 userlog.d.actions["unfreeze_logging"] = unfreeze_logging
 
 
+def _can_view_audit_log(guild_id: int) -> bool:
+    """Check if the bot has permissions to view the audit logs in the given guild, this is cached per guild."""
+    can_view: bool | None = userlog.d.audit_log_perms_cache.get(guild_id)
+
+    if can_view is None:
+        me = userlog.app.cache.get_member(guild_id, userlog.app.user_id)
+        if me is None:  # Cannot tell, so try anyway
+            return True
+
+        can_view = bool(lightbulb.utils.permissions_for(me) & hikari.Permissions.VIEW_AUDIT_LOG)
+        userlog.d.audit_log_perms_cache[guild_id] = can_view
+
+    return can_view
+
+
 async def find_auditlog_data(
     guild: hikari.SnowflakeishOr[hikari.PartialGuild],
     *,
@@ -357,77 +560,169 @@ async def find_auditlog_data(
     ValueError
         The passed event has no guild attached to it, or was not found in cache.
     """
+    guild_id = hikari.Snowflake(guild)
+
+    # No point waiting for entries we will never receive
+    if not _can_view_audit_log(guild_id):
+        return None
+
     # Stuff that is observed to just take too goddamn long to appear in AuditLogs
     takes_an_obscene_amount_of_time = [hikari.AuditLogEventType.MESSAGE_BULK_DELETE]
 
-    sleep_time = 5.0 if event_type not in takes_an_obscene_amount_of_time else 10.0
-    await asyncio.sleep(sleep_time)  # Wait for auditlog event to hopefully arrive
+    timeout = 5.0 if event_type not in takes_an_obscene_amount_of_time else 10.0
 
-    return userlog.app.audit_log_cache.get_first_by(
-        guild,
-        event_type,
-        lambda e: (e.target_id == user_id if user_id else True)
-        and e.id.created_at > helpers.utcnow() - datetime.timedelta(seconds=15),
-    )
+    # Wait for auditlog event to hopefully arrive, return as soon as it does
+    try:
+        event = await userlog.app.wait_for(
+            hikari.AuditLogEntryCreateEvent,
+            timeout=timeout,
+            predicate=lambda e: e.guild_id == guild_id
+            and e.entry.action_type == event_type
+            and (e.entry.target_id == user_id if user_id else True),
+        )
+        return event.entry
+    except asyncio.TimeoutError:
+        pass
+
+    # The entry may have arrived before we started waiting
+    cutoff = helpers.utcnow() - datetime.timedelta(seconds=15)
+
+    if not user_id:
+        return userlog.app.audit_log_cache.get_first_by(guild_id, event_type, lambda e: e.id.created_at > cutoff)
+
+    for entry in reversed(userlog.app.audit_log_cache.get_for_target(guild_id, event_type, user_id)):
+        if entry.id.created_at > cutoff:
+            return entry
 
+    return None
 
-async def get_perms_diff(old_role: hikari.Role, role: hikari.Role) -> str | None:
+
+def get_perms_diff(old_role: hikari.Role, role: hikari.Role, *, is_colored: bool) -> str | None:
     """A helper function for displaying role updates.
     Returns a string containing the differences between two roles.
     """
     old_perms = old_role.permissions
     new_perms = role.permissions
-    perms_diff = ""
-    is_colored = await is_color_enabled(role.guild_id)
-    gray = "[1;30m" if is_colored else ""
-    white = "[0;37m" if is_colored else ""
-    red = "[1;31m" if is_colored else ""
-    green = "[1;32m" if is_colored else ""
-    reset = "[0m" if is_colored else ""
-
-    for perm in hikari.Permissions:
-        if (old_perms & perm) == (new_perms & perm):
+    changed = old_perms ^ new_perms
+
+    if not changed:
+        return None
+
+    lines: list[str] = []
+    gray, white, red, green, reset = ANSI_COLORS if is_colored else NO_COLORS
+
+    for perm in ALL_PERMISSIONS:
+        if not (changed & perm):
             continue
 
         old_state = f"{green}Allow" if (old_perms & perm) else f"{red}Deny"
         new_state = f"{green}Allow" if (new_perms & perm) else f"{red}Deny"
 
-        perms_diff = f"{perms_diff}\n   {white}{get_perm_str(perm)}: {old_state} {gray}-> {new_state}"
+        lines.append(f"   {white}{get_perm_str(perm)}: {old_state} {gray}-> {new_state}")
 
-    return perms_diff.strip() + reset if perms_diff.strip() else None
+    return "\n".join(lines).strip() + reset if lines else None
 
 
 T = t.TypeVar("T")
 
+DiffGetters = tuple[tuple[str, t.Callable[[t.Any], t.Any]], ...]
+"""A sequence of (label, getter) pairs used by get_diff to resolve attributes."""
+
+
+def compile_diff_attrs(attrs: dict[str, str], *, strict: bool = True) -> DiffGetters:
+    """Turn a mapping of attribute:label into precompiled getters for use with get_diff.
+
+    If strict is False, missing attributes resolve to hikari.UNDEFINED instead of raising.
+    """
+    if strict:
+        return tuple((label, operator.attrgetter(attribute)) for attribute, label in attrs.items())
+
+    return tuple(
+        (label, functools.partial(_getattr_or_undefined, attribute=attribute)) for attribute, label in attrs.items()
+    )
+
+
+def _getattr_or_undefined(obj: t.Any, *, attribute: str) -> t.Any:
+    return getattr(obj, attribute, hikari.UNDEFINED)
+
+
+ROLE_DIFF_GETTERS = compile_diff_attrs(
+    {
+        "name": "Name",
+        "position": "Position",
+        "is_hoisted": "Hoisted",
+        "is_mentionable": "Mentionable",
+        "color": "Color",
+        "icon_hash": "Icon Hash",
+        "unicode_emoji": "Unicode Emoji",
+    }
+)
 
-async def get_diff(guild_id: int, old_object: T, object: T, attrs: dict[str, str]) -> str | None:
+CHANNEL_DIFF_GETTERS = compile_diff_attrs(
+    {
+        "name": "Name",
+        "position": "Position",
+        "parent_id": "Category",
+    }
+)
+# Not all textable channels have a topic (e.g. voice channels)
+TEXTABLE_CHANNEL_DIFF_GETTERS = compile_diff_attrs({"topic": "Topic", "is_nsfw": "Is NSFW"}, strict=False)
+TEXT_CHANNEL_DIFF_GETTERS = compile_diff_attrs({"rate_limit_per_user": "Slowmode duration"})
+AUDIO_CHANNEL_DIFF_GETTERS = compile_diff_attrs(
+    {"bitrate": "Bitrate", "region": "Region", "user_limit": "User limit"}, strict=False
+)
+VOICE_CHANNEL_DIFF_GETTERS = compile_diff_attrs({"video_quality_mode": "Video Quality"})
+
+GUILD_DIFF_GETTERS = compile_diff_attrs(
+    {
+        "name": "Name",
+        "icon_url": "Icon URL",
+        "features": "Features",
+        "afk_channel_id": "AFK Channel",
+        "afk_timeout": "AFK Timeout",
+        "banner_url": "Banner URL",
+        "default_message_notifications": "Default Notification Level",
+        "description": "Description",
+        "discovery_splash_hash": "Discovery Splash",
+        "explicit_content_filter": "Explicit Content Filter",
+        "is_widget_enabled": "Widget Enabled",
+        "banner_hash": "Banner",
+        "mfa_level": "MFA Level",
+        "owner_id": "Owner ID",
+        "preferred_locale": "Locale",
+        "premium_tier": "Nitro Tier",
+        "public_updates_channel_id": "Public Updates Channel",
+        "rules_channel_id": "Rules Channel",
+        "splash_hash": "Splash",
+        "system_channel_id": "System Channel",
+        "system_channel_flags": "System Channel Flags",
+        "vanity_url_code": "Vanity URL",
+        "verification_level": "Verification Level",
+        "widget_channel_id": "Widget channel",
+        "nsfw_level": "NSFW Level",
+    }
+)
+
+
+def get_diff(old_object: T, object: T, getters: DiffGetters, *, is_colored: bool) -> str | None:
     """A helper function for displaying differences between certain attributes
     Returns a formatted string containing the differences.
     The two objects are expected to share the same attributes.
     """
-    diff = ""
+    lines: list[str] = []
+    gray, white, red, green, reset = ANSI_COLORS if is_colored else NO_COLORS
 
-    is_colored = await is_color_enabled(guild_id)
-    gray = "[1;30m" if is_colored else ""
-    white = "[0;37m" if is_colored else ""
-    red = "[1;31m" if is_colored else ""
-    green = "[1;32m" if is_colored else ""
-    reset = "[0m" if is_colored else ""
+    for label, getter in getters:
+        old = getter(old_object)
+        new = getter(object)
 
-    for attribute in attrs:
-        old = getattr(old_object, attribute, hikari.UNDEFINED)
-        new = getattr(object, attribute, hikari.UNDEFINED)
+        if old == new:
+            continue
 
         if hasattr(old, "name") and hasattr(new, "name"):  # Handling flags enums
-            diff = (
-                f"{diff}\n{white}{attrs[attribute]}: {red}{old.name} {gray}-> {green}{new.name}" if old != new else diff
-            )
+            lines.append(f"{white}{label}: {red}{old.name} {gray}-> {green}{new.name}")
         elif isinstance(old, datetime.timedelta) and isinstance(new, datetime.timedelta):  # Handling timedeltas
-            diff = (
-                f"{diff}\n{white}{attrs[attribute]}: {red}{old.total_seconds()} {gray}-> {green}{new.total_seconds()}"
-                if old != new
-                else diff
-            )
+            lines.append(f"{white}{label}: {red}{old.total_seconds()} {gray}-> {green}{new.total_seconds()}")
         elif (
             isinstance(old, list)
             and isinstance(new, list)
@@ -438,15 +733,11 @@ async def get_diff(guild_id: int, old_object: T, object: T, attrs: dict[str, str
             if not set(old_names) - set(new_names) or not set(new_names) - set(old_names):
                 continue
 
-            diff = (
-                f"{diff}\n{white}{attrs[attribute]}: {red}{', '.join(old_names)} {gray}-> {green}{', '.join(new_names)}"
-                if old != new
-                else diff
-            )
+            lines.append(f"{white}{label}: {red}{', '.join(old_names)} {gray}-> {green}{', '.join(new_names)}")
         else:
-            diff = f"{diff}\n{white}{attrs[attribute]}: {red}{old} {gray}-> {green}{new}" if old != new else diff
+            lines.append(f"{white}{label}: {red}{old} {gray}-> {green}{new}")
 
-    return diff.strip() + reset if diff.strip() else None
+    return "\n".join(lines) + reset if lines else None
 
 
 def create_log_content(message: hikari.PartialMessage, max_length: int | None = None) -> str:
@@ -476,6 +767,9 @@ async def message_delete(plugin: SnedPlugin, event: hikari.GuildMessageDeleteEve
     if not event.old_message or event.old_message.author.is_bot:
         return
 
+    if not await _has_log_channel(event.guild_id, LogEvent.MESSAGE_DELETE_MOD, LogEvent.MESSAGE_DELETE):
+        return
+
     contents = create_log_content(event.old_message)
 
     entry = await find_auditlog_data(
@@ -494,7 +788,7 @@ async def message_delete(plugin: SnedPlugin, event: hikari.GuildMessageDeleteEve
 **Message content:** ```{contents.replace("`", "´")}```""",
             color=const.ERROR_COLOR,
         )
-        await log(LogEvent.MESSAGE_DELETE_MOD, embed, event.guild_id)
+        log(LogEvent.MESSAGE_DELETE_MOD, embed, event.guild_id)
 
     else:
         embed = hikari.Embed(
@@ -504,7 +798,7 @@ async def message_delete(plugin: SnedPlugin, event: hikari.GuildMessageDeleteEve
 **Message content:** ```{contents.replace("`", "´")}```""",
             color=const.ERROR_COLOR,
         )
-        await log(LogEvent.MESSAGE_DELETE, embed, event.guild_id)
+        log(LogEvent.MESSAGE_DELETE, embed, event.guild_id)
 
 
 @userlog.listener(hikari.GuildMessageUpdateEvent, bind=True)
@@ -535,11 +829,14 @@ async def message_update(plugin: SnedPlugin, event: hikari.GuildMessageUpdateEve
 [Jump!]({event.message.make_link(event.guild_id)})""",
         color=const.EMBED_BLUE,
     )
-    await log(LogEvent.MESSAGE_EDIT, embed, event.guild_id)
+    log(LogEvent.MESSAGE_EDIT, embed, event.guild_id)
 
 
 @userlog.listener(hikari.GuildBulkMessageDeleteEvent, bind=True)
 async def bulk_message_delete(plugin: SnedPlugin, event: hikari.GuildBulkMessageDeleteEvent) -> None:
+    if not await _has_log_channel(event.guild_id, LogEvent.BULK_DELETE):
+        return
+
     moderator = None
     entry = await find_auditlog_data(event.guild_id, event_type=hikari.AuditLogEventType.MESSAGE_BULK_DELETE)
     if entry:
@@ -555,11 +852,17 @@ async def bulk_message_delete(plugin: SnedPlugin, event: hikari.GuildBulkMessage
 ```{len(event.message_ids)} messages have been purged.```""",
         color=const.ERROR_COLOR,
     )
-    await log(LogEvent.BULK_DELETE, embed, event.guild_id)
+    log(LogEvent.BULK_DELETE, embed, event.guild_id)
 
 
 @userlog.listener(hikari.RoleDeleteEvent, bind=True)
 async def role_delete(plugin: SnedPlugin, event: hikari.RoleDeleteEvent) -> None:
+    userlog.d.log_perms_cache.clear()
+    userlog.d.audit_log_perms_cache.pop(event.guild_id, None)
+
+    if not await _has_log_channel(event.guild_id, LogEvent.ROLES):
+        return
+
     entry = await find_auditlog_data(event.guild_id, event_type=hikari.AuditLogEventType.ROLE_DELETE)
     if entry and event.old_role:
         assert entry.user_id is not None
@@ -569,11 +872,14 @@ async def role_delete(plugin: SnedPlugin, event: hikari.RoleDeleteEvent) -> None
             description=f"**Role:** `{event.old_role}`\n**Moderator:** `{display_user(moderator)}`",
             color=const.ERROR_COLOR,
         )
-        await log(LogEvent.ROLES, embed, event.guild_id)
+        log(LogEvent.ROLES, embed, event.guild_id)
 
 
 @userlog.listener(hikari.RoleCreateEvent, bind=True)
 async def role_create(plugin: SnedPlugin, event: hikari.RoleCreateEvent) -> None:
+    if not await _has_log_channel(event.guild_id, LogEvent.ROLES):
+        return
+
     entry = await find_auditlog_data(event.guild_id, event_type=hikari.AuditLogEventType.ROLE_CREATE)
     if entry and event.role:
         assert entry.user_id is not None
@@ -583,27 +889,25 @@ async def role_create(plugin: SnedPlugin, event: hikari.RoleCreateEvent) -> None
             description=f"**Role:** `{event.role}`\n**Moderator:** `{display_user(moderator)}`",
             color=const.EMBED_GREEN,
         )
-        await log(LogEvent.ROLES, embed, event.guild_id)
+        log(LogEvent.ROLES, embed, event.guild_id)
 
 
 @userlog.listener(hikari.RoleUpdateEvent, bind=True)
 async def role_update(plugin: SnedPlugin, event: hikari.RoleUpdateEvent) -> None:
+    userlog.d.log_perms_cache.clear()
+    userlog.d.audit_log_perms_cache.pop(event.guild_id, None)
+
+    if not await _has_log_channel(event.guild_id, LogEvent.ROLES):
+        return
+
     entry = await find_auditlog_data(event.guild_id, event_type=hikari.AuditLogEventType.ROLE_UPDATE)
     if entry and event.old_role:
         assert entry.user_id
         moderator = plugin.app.cache.get_member(event.guild_id, entry.user_id)
 
-        attrs = {
-            "name": "Name",
-            "position": "Position",
-            "is_hoisted": "Hoisted",
-            "is_mentionable": "Mentionable",
-            "color": "Color",
-            "icon_hash": "Icon Hash",
-            "unicode_emoji": "Unicode Emoji",
-        }
-        diff = await get_diff(event.guild_id, event.old_role, event.role, attrs)
-        perms_diff = await get_perms_diff(event.old_role, event.role)
+        is_colored = await is_color_enabled(event.guild_id)
+        diff = get_diff(event.old_role, event.role, ROLE_DIFF_GETTERS, is_colored=is_colored)
+        perms_diff = get_perms_diff(event.old_role, event.role, is_colored=is_colored)
         if not diff and not perms_diff:
             diff = "Changes could not be resolved."
 
@@ -613,11 +917,17 @@ async def role_update(plugin: SnedPlugin, event: hikari.RoleUpdateEvent) -> None
             description=f"""**Role:** `{event.role.name}` \n**Moderator:** `{display_user(moderator)}`\n**Changes:**```ansi\n{diff}{perms_str}```""",
             color=const.EMBED_BLUE,
         )
-        await log(LogEvent.ROLES, embed, event.guild_id)
+        log(LogEvent.ROLES, embed, event.guild_id)
 
 
 @userlog.listener(hikari.GuildChannelDeleteEvent, bind=True)
 async def channel_delete(plugin: SnedPlugin, event: hikari.GuildChannelDeleteEvent) -> None:
+    userlog.d.log_channel_cache.pop(event.channel_id, None)
+    userlog.d.log_perms_cache.pop(event.channel_id, None)
+
+    if not await _has_log_channel(event.guild_id, LogEvent.CHANNELS):
+        return
+
     entry = await find_auditlog_data(event.guild_id, event_type=hikari.AuditLogEventType.CHANNEL_DELETE)
     if entry and event.channel:
         assert entry.user_id is not None
@@ -627,11 +937,14 @@ async def channel_delete(plugin: SnedPlugin, event: hikari.GuildChannelDeleteEve
             description=f"**Channel:** `{event.channel.name}` `({event.channel.type.name})`\n**Moderator:** `{display_user(moderator)}`",  # type: ignore
             color=const.ERROR_COLOR,
         )
-        await log(LogEvent.CHANNELS, embed, event.guild_id)
+        log(LogEvent.CHANNELS, embed, event.guild_id)
 
 
 @userlog.listener(hikari.GuildChannelCreateEvent, bind=True)
 async def channel_create(plugin: SnedPlugin, event: hikari.GuildChannelCreateEvent) -> None:
+    if not await _has_log_channel(event.guild_id, LogEvent.CHANNELS):
+        return
+
     entry = await find_auditlog_data(event.guild_id, event_type=hikari.AuditLogEventType.CHANNEL_CREATE)
     if entry and event.channel:
         assert entry.user_id is not None
@@ -641,11 +954,17 @@ async def channel_create(plugin: SnedPlugin, event: hikari.GuildChannelCreateEve
             description=f"**Channel:** {event.channel.mention} `({event.channel.type.name})`\n**Moderator:** `{display_user(moderator)}`",  # type: ignore
             color=const.EMBED_GREEN,
         )
-        await log(LogEvent.CHANNELS, embed, event.guild_id)
+        log(LogEvent.CHANNELS, embed, event.guild_id)
 
 
 @userlog.listener(hikari.GuildChannelUpdateEvent, bind=True)
 async def channel_update(plugin: SnedPlugin, event: hikari.GuildChannelUpdateEvent) -> None:
+    userlog.d.log_channel_cache.pop(event.channel_id, None)
+    userlog.d.log_perms_cache.pop(event.channel_id, None)
+
+    if not await _has_log_channel(event.guild_id, LogEvent.CHANNELS):
+        return
+
     entry = await find_auditlog_data(event.guild_id, event_type=hikari.AuditLogEventType.CHANNEL_UPDATE)
 
     if entry and event.old_channel:
@@ -655,26 +974,20 @@ async def channel_update(plugin: SnedPlugin, event: hikari.GuildChannelUpdateEve
         if moderator and moderator.is_bot:  # Ignore bots updating channels
             return
 
-        attrs = {
-            "name": "Name",
-            "position": "Position",
-            "parent_id": "Category",
-        }
+        getters = CHANNEL_DIFF_GETTERS
         if isinstance(event.channel, hikari.TextableGuildChannel):
-            attrs["topic"] = "Topic"
-            attrs["is_nsfw"] = "Is NSFW"
+            getters += TEXTABLE_CHANNEL_DIFF_GETTERS
 
         if isinstance(event.channel, hikari.GuildTextChannel):
-            attrs["rate_limit_per_user"] = "Slowmode duration"
+            getters += TEXT_CHANNEL_DIFF_GETTERS
 
         if isinstance(event.channel, (hikari.GuildVoiceChannel, hikari.GuildStageChannel)):
-            attrs["bitrate"] = "Bitrate"
-            attrs["region"] = "Region"
-            attrs["user_limit"] = "User limit"
+            getters += AUDIO_CHANNEL_DIFF_GETTERS
         if isinstance(event.channel, hikari.GuildVoiceChannel):
-            attrs["video_quality_mode"] = "Video Quality"
+            getters += VOICE_CHANNEL_DIFF_GETTERS
 
-        diff = await get_diff(event.guild_id, event.old_channel, event.channel, attrs)
+        is_colored = await is_color_enabled(event.guild_id)
+        diff = get_diff(event.old_channel, event.channel, getters, is_colored=is_colored)
 
         # Because displaying this nicely is practically impossible
         if event.old_channel.permission_overwrites != event.channel.permission_overwrites:
@@ -687,11 +1000,14 @@ async def channel_update(plugin: SnedPlugin, event: hikari.GuildChannelUpdateEve
             description=f"Channel {event.channel.mention} was updated by `{display_user(moderator)}`.\n**Changes:**\n```ansi\n{diff}```",
             color=const.EMBED_BLUE,
         )
-        await log(LogEvent.CHANNELS, embed, event.guild_id)
+        log(LogEvent.CHANNELS, embed, event.guild_id)
 
 
 @userlog.listener(hikari.GuildUpdateEvent, bind=True)
 async def guild_update(plugin: SnedPlugin, event: hikari.GuildUpdateEvent) -> None:
+    if not await _has_log_channel(event.guild_id, LogEvent.GUILD_SETTINGS):
+        return
+
     entry = await find_auditlog_data(event.guild_id, event_type=hikari.AuditLogEventType.GUILD_UPDATE)
 
     moderator = None
@@ -707,34 +1023,8 @@ async def guild_update(plugin: SnedPlugin, event: hikari.GuildUpdateEvent) -> No
             # If someone boosted but there was no tier change, ignore
             return
 
-        attrs = {
-            "name": "Name",
-            "icon_url": "Icon URL",
-            "features": "Features",
-            "afk_channel_id": "AFK Channel",
-            "afk_timeout": "AFK Timeout",
-            "banner_url": "Banner URL",
-            "default_message_notifications": "Default Notification Level",
-            "description": "Description",
-            "discovery_splash_hash": "Discovery Splash",
-            "explicit_content_filter": "Explicit Content Filter",
-            "is_widget_enabled": "Widget Enabled",
-            "banner_hash": "Banner",
-            "mfa_level": "MFA Level",
-            "owner_id": "Owner ID",
-            "preferred_locale": "Locale",
-            "premium_tier": "Nitro Tier",
-            "public_updates_channel_id": "Public Updates Channel",
-            "rules_channel_id": "Rules Channel",
-            "splash_hash": "Splash",
-            "system_channel_id": "System Channel",
-            "system_channel_flags": "System Channel Flags",
-            "vanity_url_code": "Vanity URL",
-            "verification_level": "Verification Level",
-            "widget_channel_id": "Widget channel",
-            "nsfw_level": "NSFW Level",
-        }
-        diff = await get_diff(event.guild_id, event.old_guild, event.guild, attrs)
+        is_colored = await is_color_enabled(event.guild_id)
+        diff = get_diff(event.old_guild, event.guild, GUILD_DIFF_GETTERS, is_colored=is_colored)
         diff = diff or "Changes could not be resolved."
 
         embed = hikari.Embed(
@@ -742,7 +1032,7 @@ async def guild_update(plugin: SnedPlugin, event: hikari.GuildUpdateEvent) -> No
             description=f"Guild settings have been updated by `{display_user(moderator)}`.\n**Changes:**\n```ansi\n{diff}```",
             color=const.EMBED_BLUE,
         )
-        await log(LogEvent.GUILD_SETTINGS, embed, event.guild_id)
+        log(LogEvent.GUILD_SETTINGS, embed, event.guild_id)
 
 
 @userlog.listener(hikari.BanDeleteEvent, bind=True)
@@ -768,16 +1058,18 @@ async def member_ban_remove(plugin: SnedPlugin, event: hikari.BanDeleteEvent) ->
         description=f"**Offender:** `{display_user(event.user)}`\n**Moderator:** `{display_user(moderator)}`\n**Reason:** ```{reason}```",
         color=const.EMBED_GREEN,
     )
-    await log(LogEvent.BAN, embed, event.guild_id)
+    log(LogEvent.BAN, embed, event.guild_id)
 
-    await JournalEntry(
-        user_id=event.user.id,
-        guild_id=event.guild_id,
-        entry_type=JournalEntryType.UNBAN,
-        content=reason,
-        author_id=moderator.id if isinstance(moderator, (UserLike, hikari.PartialUser)) else None,
-        created_at=helpers.utcnow(),
-    ).update()
+    queue_journal_entry(
+        JournalEntry(
+            user_id=event.user.id,
+            guild_id=event.guild_id,
+            entry_type=JournalEntryType.UNBAN,
+            content=reason,
+            author_id=moderator.id if isinstance(moderator, (UserLike, hikari.PartialUser)) else None,
+            created_at=helpers.utcnow(),
+        )
+    )
 
 
 @userlog.listener(hikari.BanCreateEvent, bind=True)
@@ -803,16 +1095,18 @@ async def member_ban_add(plugin: SnedPlugin, event: hikari.BanCreateEvent) -> No
         description=f"**Offender:** `{display_user(event.user)}`\n**Moderator: **`{display_user(moderator)}`\n**Reason:**```{reason}```",
         color=const.ERROR_COLOR,
     )
-    await log(LogEvent.BAN, embed, event.guild_id)
+    log(LogEvent.BAN, embed, event.guild_id)
 
-    await JournalEntry(
-        user_id=event.user.id,
-        guild_id=event.guild_id,
-        entry_type=JournalEntryType.BAN,
-        content=reason,
-        author_id=moderator.id if isinstance(moderator, (UserLike, hikari.PartialUser)) else None,
-        created_at=helpers.utcnow(),
-    ).update()
+    queue_journal_entry(
+        JournalEntry(
+            user_id=event.user.id,
+            guild_id=event.guild_id,
+            entry_type=JournalEntryType.BAN,
+            content=reason,
+            author_id=moderator.id if isinstance(moderator, (UserLike, hikari.PartialUser)) else None,
+            created_at=helpers.utcnow(),
+        )
+    )
 
 
 @userlog.listener(hikari.MemberDeleteEvent, bind=True)
@@ -839,16 +1133,18 @@ async def member_delete(plugin: SnedPlugin, event: hikari.MemberDeleteEvent) ->
             description=f"**Offender:** `{display_user(event.user)}`\n**Moderator:**`{display_user(moderator)}`\n**Reason:**```{reason}```",
             color=const.ERROR_COLOR,
         )
-        await log(LogEvent.KICK, embed, event.guild_id)
+        log(LogEvent.KICK, embed, event.guild_id)
 
-        await JournalEntry(
-            user_id=event.user.id,
-            guild_id=event.guild_id,
-            entry_type=JournalEntryType.KICK,
-            content=reason,
-            author_id=moderator.id if isinstance(moderator, (UserLike, hikari.PartialUser)) else None,
-            created_at=helpers.utcnow(),
-        ).update()
+        queue_journal_entry(
+            JournalEntry(
+                user_id=event.user.id,
+                guild_id=event.guild_id,
+                entry_type=JournalEntryType.KICK,
+                content=reason,
+                author_id=moderator.id if isinstance(moderator, (UserLike, hikari.PartialUser)) else None,
+                created_at=helpers.utcnow(),
+            )
+        )
         return
 
     embed = hikari.Embed(
@@ -856,7 +1152,7 @@ async def member_delete(plugin: SnedPlugin, event: hikari.MemberDeleteEvent) ->
         description=f"**User:** `{display_user(event.user)}`\n**User count:** `{len(plugin.app.cache.get_members_view_for_guild(event.guild_id))}`",
         color=const.ERROR_COLOR,
     ).set_thumbnail(event.user.display_avatar_url)
-    await log(LogEvent.MEMBER_LEAVE, embed, event.guild_id)
+    log(LogEvent.MEMBER_LEAVE, embed, event.guild_id)
 
 
 @userlog.listener(hikari.MemberCreateEvent, bind=True)
@@ -874,21 +1170,35 @@ async def member_create(plugin: SnedPlugin, event: hikari.MemberCreateEvent) ->
         )
         .set_thumbnail(event.member.display_avatar_url)
     )
-    await log(LogEvent.MEMBER_JOIN, embed, event.guild_id)
+    log(LogEvent.MEMBER_JOIN, embed, event.guild_id)
 
 
 @userlog.listener(hikari.MemberUpdateEvent, bind=True)
 async def member_update(plugin: SnedPlugin, event: hikari.MemberUpdateEvent) -> None:
+    if event.user_id == plugin.app.user_id:
+        # Our roles may have changed, so our permissions might have too
+        userlog.d.log_perms_cache.clear()
+        userlog.d.audit_log_perms_cache.pop(event.guild_id, None)
+
     if not event.old_member:
         return
 
     old_member = event.old_member
     member = event.member
+    cache = plugin.app.cache
+    old_comms_disabled_until = old_member.communication_disabled_until()
+    comms_disabled_until = member.communication_disabled_until()
 
-    if old_member.communication_disabled_until() != member.communication_disabled_until():
-        """Timeout logging"""
-        comms_disabled_until = member.communication_disabled_until()
+    # Most member updates are for things we do not log (e.g. avatars, boosts)
+    if (
+        old_comms_disabled_until == comms_disabled_until
+        and old_member.nickname == member.nickname
+        and old_member.role_ids == member.role_ids
+    ):
+        return
 
+    if old_comms_disabled_until != comms_disabled_until:
+        """Timeout logging"""
         entry = await find_auditlog_data(
             event.guild_id, event_type=hikari.AuditLogEventType.MEMBER_UPDATE, user_id=event.user.id
         )
@@ -896,7 +1206,7 @@ async def member_update(plugin: SnedPlugin, event: hikari.MemberUpdateEvent) ->
             return
 
         assert entry.user_id is not None
-        moderator = plugin.app.cache.get_member(event.guild_id, entry.user_id)
+        moderator = cache.get_member(event.guild_id, entry.user_id)
 
         # Reason parsing
         if entry.user_id == plugin.app.user_id and entry.reason:
@@ -923,16 +1233,18 @@ async def member_update(plugin: SnedPlugin, event: hikari.MemberUpdateEvent) ->
                 description=f"**User:** `{display_user(member)}` \n**Moderator:** `{display_user(moderator)}` \n**Reason:** ```{reason}```",
                 color=const.EMBED_GREEN,
             )
-            await log(LogEvent.TIMEOUT, embed, event.guild_id)
-
-            await JournalEntry(
-                user_id=event.user.id,
-                guild_id=event.guild_id,
-                entry_type=JournalEntryType.TIMEOUT_REMOVE,
-                content=reason,
-                author_id=moderator.id if moderator else None,
-                created_at=helpers.utcnow(),
-            ).update()
+            log(LogEvent.TIMEOUT, embed, event.guild_id)
+
+            queue_journal_entry(
+                JournalEntry(
+                    user_id=event.user.id,
+                    guild_id=event.guild_id,
+                    entry_type=JournalEntryType.TIMEOUT_REMOVE,
+                    content=reason,
+                    author_id=moderator.id if moderator else None,
+                    created_at=helpers.utcnow(),
+                )
+            )
             return
 
         assert comms_disabled_until is not None
@@ -946,16 +1258,18 @@ async def member_update(plugin: SnedPlugin, event: hikari.MemberUpdateEvent) ->
             color=const.ERROR_COLOR,
         )
 
-        await JournalEntry(
-            user_id=event.user.id,
-            guild_id=event.guild_id,
-            entry_type=JournalEntryType.TIMEOUT,
-            content=f"Until {helpers.format_dt(comms_disabled_until, style='d')} - {reason}",
-            author_id=moderator.id if moderator else None,
-            created_at=helpers.utcnow(),
-        ).update()
+        queue_journal_entry(
+            JournalEntry(
+                user_id=event.user.id,
+                guild_id=event.guild_id,
+                entry_type=JournalEntryType.TIMEOUT,
+                content=f"Until {helpers.format_dt(comms_disabled_until, style='d')} - {reason}",
+                author_id=moderator.id if moderator else None,
+                created_at=helpers.utcnow(),
+            )
+        )
 
-        await log(LogEvent.TIMEOUT, embed, event.guild_id)
+        log(LogEvent.TIMEOUT, embed, event.guild_id)
 
     elif old_member.nickname != member.nickname:
         """Nickname change handling"""
@@ -964,27 +1278,40 @@ async def member_update(plugin: SnedPlugin, event: hikari.MemberUpdateEvent) ->
             description=f"**User:** `{display_user(member)}`\nNickname before: `{old_member.nickname}`\nNickname after: `{member.nickname}`",
             color=const.EMBED_BLUE,
         )
-        await log(LogEvent.NICKNAME, embed, event.guild_id)
+        log(LogEvent.NICKNAME, embed, event.guild_id)
 
     elif old_member.role_ids != member.role_ids:
-        # Check difference in roles between the two
-        add_diff = list(set(member.role_ids) - set(old_member.role_ids))
-        rem_diff = list(set(old_member.role_ids) - set(member.role_ids))
+        # Snapshot both role sets once, then reuse them for the comparison and the diff
+        old_role_ids = frozenset(old_member.role_ids)
+        role_ids = frozenset(member.role_ids)
 
-        if not add_diff and not rem_diff:
-            # No idea why this is needed, but otherwise I get empty role updates
+        if old_role_ids == role_ids:
+            # Only the order changed, otherwise I get empty role updates
             return
 
-        role = userlog.app.cache.get_role(add_diff[0]) if add_diff else userlog.app.cache.get_role(rem_diff[0])
+        # Only the first changed role is logged, so stop at the first hit instead of building full diffs
+        added_role_id = next((role_id for role_id in member.role_ids if role_id not in old_role_ids), None)
+        removed_role_id = (
+            next((role_id for role_id in old_member.role_ids if role_id not in role_ids), None)
+            if added_role_id is None
+            else None
+        )
+        changed_role_id = added_role_id or removed_role_id
+        assert changed_role_id is not None
+
+        role = cache.get_role(changed_role_id)
 
         if role and role.is_managed:  # Do not handle roles managed by bots & other integration stuff
             return
 
+        if not await _has_log_channel(event.guild_id, LogEvent.ROLES):
+            return
+
         entry = await find_auditlog_data(
             event.guild_id, event_type=hikari.AuditLogEventType.MEMBER_ROLE_UPDATE, user_id=event.user.id
         )
 
-        moderator = plugin.app.cache.get_member(event.guild_id, entry.user_id) if entry and entry.user_id else None
+        moderator = cache.get_member(event.guild_id, entry.user_id) if entry and entry.user_id else None
 
         if moderator is None:
             return
@@ -998,21 +1325,34 @@ async def member_update(plugin: SnedPlugin, event: hikari.MemberUpdateEvent) ->
             # Provided that the role was not added through /role
             return
 
-        if add_diff:
+        if added_role_id:
             embed = hikari.Embed(
                 title="🖊️ Member roles updated",
-                description=f"**User:** `{display_user(member)}`\n**Moderator:** `{display_user(moderator)}`\n**Role added:** <@&{add_diff[0]}>",
+                description=f"**User:** `{display_user(member)}`\n**Moderator:** `{display_user(moderator)}`\n**Role added:** <@&{added_role_id}>",
                 color=const.EMBED_BLUE,
             )
-            await log(LogEvent.ROLES, embed, event.guild_id)
+            log(LogEvent.ROLES, embed, event.guild_id)
 
-        elif rem_diff:
+        elif removed_role_id:
             embed = hikari.Embed(
                 title="🖊️ Member roles updated",
-                description=f"**User:** `{display_user(member)}`\n**Moderator:** `{display_user(moderator)}`\n**Role removed:** <@&{rem_diff[0]}>",
+                description=f"**User:** `{display_user(member)}`\n**Moderator:** `{display_user(moderator)}`\n**Role removed:** <@&{removed_role_id}>",
                 color=const.EMBED_BLUE,
             )
-            await log(LogEvent.ROLES, embed, event.guild_id)
+            log(LogEvent.ROLES, embed, event.guild_id)
+
+
+@userlog.listener(hikari.GuildLeaveEvent)
+async def guild_leave(event: hikari.GuildLeaveEvent) -> None:
+    clear_log_config_cache(event.guild_id)
+    userlog.d.audit_log_perms_cache.pop(event.guild_id, None)
+
+    channel_ids = [
+        channel_id for channel_id, channel in userlog.d.log_channel_cache.items() if channel.guild_id == event.guild_id
+    ]
+    for channel_id in channel_ids:
+        userlog.d.log_channel_cache.pop(channel_id, None)
+        userlog.d.log_perms_cache.pop(channel_id, None)
 
 
 @userlog.listener(WarnCreateEvent, bind=True)
@@ -1023,16 +1363,18 @@ async def warn_create(plugin: SnedPlugin, event: WarnCreateEvent) -> None:
         color=const.WARN_COLOR,
     )
 
-    await log(LogEvent.WARN, embed, event.guild_id)
+    log(LogEvent.WARN, embed, event.guild_id)
 
-    await JournalEntry(
-        user_id=event.member.id,
-        guild_id=event.guild_id,
-        entry_type=JournalEntryType.WARN,
-        content=event.reason,
-        author_id=hikari.Snowflake(event.moderator),
-        created_at=helpers.utcnow(),
-    ).update()
+    queue_journal_entry(
+        JournalEntry(
+            user_id=event.member.id,
+            guild_id=event.guild_id,
+            entry_type=JournalEntryType.WARN,
+            content=event.reason,
+            author_id=hikari.Snowflake(event.moderator),
+            created_at=helpers.utcnow(),
+        )
+    )
 
 
 @userlog.listener(WarnRemoveEvent, bind=True)
@@ -1043,16 +1385,18 @@ async def warn_remove(plugin: SnedPlugin, event: WarnRemoveEvent) -> None:
         color=const.EMBED_GREEN,
     )
 
-    await log(LogEvent.WARN, embed, event.guild_id)
+    log(LogEvent.WARN, embed, event.guild_id)
 
-    await JournalEntry(
-        user_id=event.member.id,
-        guild_id=event.guild_id,
-        entry_type=JournalEntryType.WARN_REMOVE,
-        content=event.reason,
-        author_id=hikari.Snowflake(event.moderator),
-        created_at=helpers.utcnow(),
-    ).update()
+    queue_journal_entry(
+        JournalEntry(
+            user_id=event.member.id,
+            guild_id=event.guild_id,
+            entry_type=JournalEntryType.WARN_REMOVE,
+            content=event.reason,
+            author_id=hikari.Snowflake(event.moderator),
+            created_at=helpers.utcnow(),
+        )
+    )
 
 
 @userlog.listener(WarnsClearEvent, bind=True)
@@ -1063,16 +1407,18 @@ async def warns_clear(plugin: SnedPlugin, event: WarnsClearEvent) -> None:
         color=const.EMBED_GREEN,
     )
 
-    await log(LogEvent.WARN, embed, event.guild_id)
+    log(LogEvent.WARN, embed, event.guild_id)
 
-    await JournalEntry(
-        user_id=event.member.id,
-        guild_id=event.guild_id,
-        entry_type=JournalEntryType.WARN_CLEAR,
-        content=event.reason,
-        author_id=hikari.Snowflake(event.moderator),
-        created_at=helpers.utcnow(),
-    ).update()
+    queue_journal_entry(
+        JournalEntry(
+            user_id=event.member.id,
+            guild_id=event.guild_id,
+            entry_type=JournalEntryType.WARN_CLEAR,
+            content=event.reason,
+            author_id=hikari.Snowflake(event.moderator),
+            created_at=helpers.utcnow(),
+        )
+    )
 
 
 @userlog.listener(AutoModMessageFlagEvent, bind=True)
@@ -1095,7 +1441,7 @@ async def flag_message(plugin: SnedPlugin, event: AutoModMessageFlagEvent) -> No
         description=f"`{display_user(user)}` was flagged by auto-moderator for suspicious behaviour.\n**Reason:**```{reason}```\n**Content:** ```{content}```\n\n[Jump to message!]({event.message.make_link(event.guild_id)})",
         color=const.ERROR_COLOR,
     )
-    await log(LogEvent.FLAGS, embed, event.guild_id)
+    log(LogEvent.FLAGS, embed, event.guild_id)
 
 
 @userlog.listener(MassBanEvent)
@@ -1105,7 +1451,7 @@ async def massban_execute(event: MassBanEvent) -> None:
         description=f"Banned **{event.successful}/{event.total}** users.\n**Moderator:** `{display_user(event.moderator)}`\n**Reason:** ```{event.reason}```",
         color=const.ERROR_COLOR,
     )
-    await log(LogEvent.BAN, log_embed, event.guild_id, file=event.logfile, bypass=True)
+    log(LogEvent.BAN, log_embed, event.guild_id, file=event.logfile, bypass=True)
 
 
 @userlog.listener(RoleButtonCreateEvent)
@@ -1115,7 +1461,7 @@ async def rolebutton_create(event: RoleButtonCreateEvent) -> None:
         description=f"**ID:** {event.rolebutton.id}\n**Channel:** <#{event.rolebutton.channel_id}>\n**Role:** <@&{event.rolebutton.role_id}>\n**Moderator:** `{display_user(event.moderator)}`",
         color=const.EMBED_GREEN,
     )
-    await log(LogEvent.ROLES, log_embed, event.guild_id)
+    log(LogEvent.ROLES, log_embed, event.guild_id)
 
 
 @userlog.listener(RoleButtonDeleteEvent)
@@ -1125,7 +1471,7 @@ async def rolebutton_delete(event: RoleButtonDeleteEvent) -> None:
         description=f"**ID:** {event.rolebutton.id}\n**Channel:** <#{event.rolebutton.channel_id}>\n**Role:** <@&{event.rolebutton.role_id}>\n**Moderator:** `{display_user(event.moderator)}`",
         color=const.ERROR_COLOR,
     )
-    await log(LogEvent.ROLES, log_embed, event.guild_id)
+    log(LogEvent.ROLES, log_embed, event.guild_id)
 
 
 @userlog.listener(RoleButtonUpdateEvent)
@@ -1135,17 +1481,23 @@ async def rolebutton_update(event: RoleButtonUpdateEvent) -> None:
         description=f"**ID:** {event.rolebutton.id}\n**Channel:** <#{event.rolebutton.channel_id}>\n**Role:** <@&{event.rolebutton.role_id}>\n**Moderator:** `{display_user(event.moderator)}`",
         color=const.EMBED_BLUE,
     )
-    await log(LogEvent.ROLES, log_embed, event.guild_id)
+    log(LogEvent.ROLES, log_embed, event.guild_id)
 
 
 def load(bot: SnedBot) -> None:
     bot.add_plugin(userlog)
     userlog.d._task = bot.create_task(_iter_queue())
+    userlog.d._journal_task = bot.create_task(_iter_journal_queue())
 
 
 def unload(bot: SnedBot) -> None:
     if userlog.d._task:
         userlog.d._task.cancel()
+    if userlog.d._journal_task:
+        userlog.d._journal_task.cancel()
+    for handle in userlog.d.unfreeze_handles.values():
+        handle.cancel()
+    userlog.d.unfreeze_handles.clear()
     bot.remove_plugin(userlog)
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import collections
 import typing as t
 
 import hikari
@@ -24,8 +25,16 @@ class AuditLogCache:
         of entries exceed this number, the oldest entries will be discarded.
     """
 
+    __slots__ = ("_cache", "_by_target", "_capacity", "_bot")
+
     def __init__(self, bot: SnedBot, capacity: int = 10) -> None:
-        self._cache: dict[hikari.Snowflake, dict[hikari.AuditLogEventType, list[hikari.AuditLogEntry]]] = {}
+        self._cache: collections.defaultdict[
+            hikari.Snowflake, dict[hikari.AuditLogEventType, collections.deque[hikari.AuditLogEntry]]
+        ] = collections.defaultdict(dict)
+        # Secondary index of the same entries, keyed by guild, event type and target
+        self._by_target: dict[
+            tuple[hikari.Snowflake, hikari.AuditLogEventType, hikari.Snowflake], collections.deque[hikari.AuditLogEntry]
+        ] = {}
         self._capacity = capacity
         self._bot = bot
 
@@ -36,7 +45,8 @@ class AuditLogCache:
     async def stop(self) -> None:
         """Stop the audit log cache listener."""
         self._bot.event_manager.unsubscribe(hikari.AuditLogEntryCreateEvent, self._listen)
-        self._cache = {}
+        self._cache.clear()
+        self._by_target.clear()
 
     async def _listen(self, event: hikari.AuditLogEntryCreateEvent) -> None:
         """Listen for audit log events."""
@@ -44,7 +54,7 @@ class AuditLogCache:
 
     def get(
         self, guild: hikari.SnowflakeishOr[hikari.PartialGuild], action_type: hikari.AuditLogEventType
-    ) -> list[hikari.AuditLogEntry]:
+    ) -> t.Sequence[hikari.AuditLogEntry]:
         """Get all audit log entries for a guild and event type.
 
         Parameters
@@ -56,10 +66,34 @@ class AuditLogCache:
 
         Returns
         -------
-        List[hikari.AuditLogEntry]
-            The audit log entries.
+        Sequence[hikari.AuditLogEntry]
+            The audit log entries, oldest first.
+        """
+        return self._cache.get(hikari.Snowflake(guild), {}).get(action_type, ())
+
+    def get_for_target(
+        self,
+        guild: hikari.SnowflakeishOr[hikari.PartialGuild],
+        action_type: hikari.AuditLogEventType,
+        target: hikari.SnowflakeishOr[hikari.Unique],
+    ) -> t.Sequence[hikari.AuditLogEntry]:
+        """Get all audit log entries for a guild and event type that affect a given target.
+
+        Parameters
+        ----------
+        guild: hikari.SnowflakeishOr[hikari.PartialGuild]
+            The guild or it's ID.
+        action_type: hikari.AuditLogEventType
+            The event type.
+        target: hikari.SnowflakeishOr[hikari.Unique]
+            The target of the entries or it's ID.
+
+        Returns
+        -------
+        Sequence[hikari.AuditLogEntry]
+            The audit log entries, oldest first.
         """
-        return self._cache.get(hikari.Snowflake(guild), {}).get(action_type, [])
+        return self._by_target.get((hikari.Snowflake(guild), action_type, hikari.Snowflake(target)), ())
 
     def get_first_by(
         self,
@@ -104,15 +138,28 @@ class AuditLogCache:
             return
 
         guild_id = hikari.Snowflake(guild)
-
-        if guild_id not in self._cache:
-            self._cache[guild_id] = {}
-
-        if entry.action_type not in self._cache[guild_id]:
-            self._cache[guild_id][entry.action_type] = []
-
-        # Remove the oldest entry if the cache is full
-        if len(self._cache[guild_id][entry.action_type]) >= self._capacity:
-            self._cache[guild_id][entry.action_type].pop(0)
-
-        self._cache[guild_id][entry.action_type].append(entry)
+        guild_entries = self._cache[guild_id]
+        entries = guild_entries.get(entry.action_type)
+
+        if entries is None:
+            # The oldest entry is discarded when appending to a full deque
+            entries = guild_entries[entry.action_type] = collections.deque(maxlen=self._capacity)
+
+        evicted = entries[0] if len(entries) == entries.maxlen else None
+        entries.append(entry)
+
+        if entry.target_id is not None:
+            key = (guild_id, entry.action_type, entry.target_id)
+            target_entries = self._by_target.get(key)
+            if target_entries is None:
+                target_entries = self._by_target[key] = collections.deque(maxlen=self._capacity)
+            target_entries.append(entry)
+
+        # Keep the target index in sync with what is still held in the main cache
+        if evicted is not None and evicted.target_id is not None:
+            key = (guild_id, evicted.action_type, evicted.target_id)
+            target_entries = self._by_target.get(key)
+            if target_entries and target_entries[0] is evicted:
+                target_entries.popleft()
+            if not target_entries:
+                self._by_target.pop(key, None)
@@ -1,4 +1,5 @@
 import asyncio
+import collections
 import datetime
 import logging
 import os
@@ -20,7 +21,12 @@ from src.models.db import Database
 from src.models.errors import UserBlacklistedError
 from src.models.mod_actions import ModActions
 from src.utils import cache, helpers, scheduler
-from src.utils.tasks import IntervalLoop
+
+BLACKLIST_CACHE_SIZE = 50000
+"""The maximum number of users whose blacklist status is remembered in memory."""
+
+DB_BACKUP_TIME = datetime.time(hour=3, tzinfo=datetime.timezone.utc)
+"""The time of day the daily database backup is performed at."""
 
 
 async def is_not_blacklisted(ctx: SnedContext) -> bool:
@@ -41,9 +47,8 @@ async def is_not_blacklisted(ctx: SnedContext) -> bool:
     UserBlacklistedError
         The user is blacklisted.
     """
-    records = await ctx.app.db_cache.get(table="blacklist", user_id=ctx.user.id)
-
-    if not records:
+    # Owners can never be blacklisted, no need to look them up
+    if ctx.user.id in ctx.app.owner_ids or not await ctx.app.is_blacklisted(ctx.user):
         return True
 
     raise UserBlacklistedError("User is blacklisted from using the application.")
@@ -71,12 +76,15 @@ class SnedBot(lightbulb.BotApp):
         "_scheduler",
         "_audit_log_cache",
         "_initial_guilds",
+        "_blacklist_cache",
         "_start_time",
         "dev_mode",
-        "skip_first_db_backup",
         "_user_id",
+        "_mention_strings",
+        "_mention_reply_embed",
         "_base_dir",
-        "_db_backup_loop",
+        "_db_backup_task",
+        "_db_backup_handle",
     )
 
     def __init__(self, config: Config) -> None:
@@ -127,13 +135,17 @@ class SnedBot(lightbulb.BotApp):
 
         # Some global variables
         self._base_dir = str(pathlib.Path(os.path.abspath(__file__)).parents[2])
-        self._db_backup_loop = IntervalLoop(self.backup_db, seconds=3600 * 24)
-        self.skip_first_db_backup = True  # Set to False to backup DB on bot startup too
+        self._db_backup_task: asyncio.Task[None] | None = None
+        self._db_backup_handle: asyncio.TimerHandle | None = None
         self._user_id: hikari.Snowflake | None = None
+        self._mention_strings: frozenset[str] = frozenset()
+        self._mention_reply_embed: hikari.Embed | None = None
         self._perspective: kosu.Client | None = None
         self._scheduler = scheduler.Scheduler(self)
         self._audit_log_cache: AuditLogCache = AuditLogCache(self)
-        self._initial_guilds: list[hikari.Snowflake] = []
+        self._initial_guilds: set[hikari.Snowflake] = set()
+        # user_id -> is_blacklisted, least recently used first
+        self._blacklist_cache: collections.OrderedDict[hikari.Snowflake, bool] = collections.OrderedDict()
         self._start_time: datetime.datetime | None = None
 
         self.check(is_not_blacklisted)
@@ -165,7 +177,7 @@ class SnedBot(lightbulb.BotApp):
     def session(self) -> aiohttp.ClientSession:
         """The aiohttp client session used by the bot."""
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            raise hikari.ComponentStateConflictError("The bot is not initialized, the session is unavailable.")
         return self._session
 
     @property
@@ -230,10 +242,58 @@ class SnedBot(lightbulb.BotApp):
         self.subscribe(hikari.StoppedEvent, self.on_stop)
         self.subscribe(hikari.GuildJoinEvent, self.on_guild_join)
         self.subscribe(hikari.GuildLeaveEvent, self.on_guild_leave)
+        self.subscribe(hikari.OwnUserUpdateEvent, self.on_own_user_update)
 
     async def wait_until_started(self) -> None:
         """Wait until the bot has started up."""
-        await asyncio.wait_for(self._started.wait(), timeout=None)
+        await self._started.wait()
+
+    async def is_blacklisted(self, user: hikari.SnowflakeishOr[hikari.PartialUser]) -> bool:
+        """Check if a user is blacklisted from using the application.
+        Results are remembered, so the database is only consulted once per user.
+
+        Parameters
+        ----------
+        user : hikari.SnowflakeishOr[hikari.PartialUser]
+            The user to check.
+
+        Returns
+        -------
+        bool
+            A boolean determining if the user is blacklisted or not.
+        """
+        user_id = hikari.Snowflake(user)
+
+        is_blacklisted = self._blacklist_cache.get(user_id)
+        if is_blacklisted is not None:
+            self._blacklist_cache.move_to_end(user_id)
+            return is_blacklisted
+
+        records = await self.db_cache.get(table="blacklist", user_id=user_id, limit=1)
+        is_blacklisted = bool(records)
+
+        if not self.db_cache.is_ready:  # The result is not authoritative
+            return is_blacklisted
+
+        self._blacklist_cache[user_id] = is_blacklisted
+        if len(self._blacklist_cache) > BLACKLIST_CACHE_SIZE:
+            self._blacklist_cache.popitem(last=False)
+
+        return is_blacklisted
+
+    def invalidate_blacklist(self, user: hikari.SnowflakeishOr[hikari.PartialUser]) -> None:
+        """Forget the remembered blacklist status of a user, should be called after modifying the blacklist.
+
+        Parameters
+        ----------
+        user : hikari.SnowflakeishOr[hikari.PartialUser]
+            The user whose status changed.
+        """
+        self._blacklist_cache.pop(hikari.Snowflake(user), None)
+
+    def clear_blacklist_cache(self) -> None:
+        """Forget the remembered blacklist status of every user, should be called after replacing the database."""
+        self._blacklist_cache.clear()
 
     async def get_slash_context(
         self,
@@ -265,11 +325,16 @@ class SnedBot(lightbulb.BotApp):
         return await super().get_prefix_context(event, cls)  # type: ignore
 
     async def on_guild_available(self, event: hikari.GuildAvailableEvent) -> None:
-        if self.is_started:
-            return
-        self._initial_guilds.append(event.guild_id)
+        # Only subscribed until startup completes, see on_lightbulb_started
+        self._initial_guilds.add(event.guild_id)
 
     async def on_starting(self, _: hikari.StartingEvent) -> None:
+        # Create a single shared session, with connection pooling and DNS caching tuned for API calls
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=10, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=60, connect=10),
+        )
+
         # Connect to the database, update schema, apply pending migrations
         await self.db.connect()
         await self.db.update_schema()
@@ -285,10 +350,11 @@ class SnedBot(lightbulb.BotApp):
         self.load_extensions_from(os.path.join(self.base_dir, "src", "extensions"), must_exist=True)
 
     async def on_started(self, _: hikari.StartedEvent) -> None:
-        self._db_backup_loop.start()
+        self._schedule_db_backup()
 
         user = self.get_me()
         self._user_id = user.id if user else None
+        self._mention_strings = frozenset((f"<@{self._user_id}>", f"<@!{self._user_id}>")) if user else frozenset()
 
         logging.info(f"Startup complete, initialized as {user}.")
         activity = hikari.Activity(name="@Sned", type=hikari.ActivityType.LISTENING)
@@ -298,49 +364,55 @@ class SnedBot(lightbulb.BotApp):
             logging.warning("Developer mode is enabled!")
 
     async def on_lightbulb_started(self, _: lightbulb.LightbulbStartedEvent) -> None:
+        # Stop collecting guilds, further availability events no longer need any handling
+        self.unsubscribe(hikari.GuildAvailableEvent, self.on_guild_available)
+
         # Insert all guilds the bot is member of into the db global config on startup
-        async with self.db.acquire() as con:
-            for guild_id in self._initial_guilds:
-                await con.execute(
-                    """
-                    INSERT INTO global_config (guild_id) VALUES ($1)
-                    ON CONFLICT (guild_id) DO NOTHING""",
-                    guild_id,
-                )
-            logging.info(f"Connected to {len(self._initial_guilds)} guilds.")
-            self._initial_guilds = []
+        await self.db.register_guilds(tuple(self._initial_guilds))
+        logging.info(f"Connected to {len(self._initial_guilds)} guilds.")
+        self._initial_guilds.clear()
 
         # Set this here so all guild_ids are in DB
         self._started.set()
         self._is_started = True
         self._start_time = helpers.utcnow()
-        self.unsubscribe(hikari.GuildAvailableEvent, self.on_guild_available)
 
     async def on_stopping(self, _: hikari.StoppingEvent) -> None:
         logging.info("Bot is shutting down...")
+        if self._db_backup_handle is not None:
+            self._db_backup_handle.cancel()
+        if self._db_backup_task is not None:
+            self._db_backup_task.cancel()
         self.scheduler.stop()
 
     async def on_stop(self, _: hikari.StoppedEvent) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
         await self.db.close()
         logging.info("Closed database connection.")
 
     async def on_message(self, event: hikari.MessageCreateEvent) -> None:
-        if not event.content:
+        # Cheap check first, as only messages that are just a mention of the bot are answered
+        if not event.content or not event.content.startswith("<@"):
             return
 
-        if self.is_ready and self.db_cache.is_ready and event.is_human:
-            mentions = [f"<@{self.user_id}>", f"<@!{self.user_id}>"]
-
-            if event.content in mentions:
+        if event.content in self._mention_strings and self.is_ready and self.db_cache.is_ready and event.is_human:
+            # The reply never changes unless our avatar does, so build it only once
+            if self._mention_reply_embed is None:
                 me = self.get_me()
-                await event.message.respond(
-                    embed=hikari.Embed(
-                        title="Beep Boop!",
-                        description="Use `/` to access my commands and see what I can do!",
-                        color=0xFEC01D,
-                    ).set_thumbnail(me.avatar_url if me else None)
-                )
-                return
+                self._mention_reply_embed = hikari.Embed(
+                    title="Beep Boop!",
+                    description="Use `/` to access my commands and see what I can do!",
+                    color=0xFEC01D,
+                ).set_thumbnail(me.avatar_url if me else None)
+
+            await event.message.respond(embed=self._mention_reply_embed)
+
+    async def on_own_user_update(self, _: hikari.OwnUserUpdateEvent) -> None:
+        # Our avatar may have changed, rebuild the mention reply on next use
+        self._mention_reply_embed = None
 
     async def on_guild_join(self, event: hikari.GuildJoinEvent) -> None:
         await self.db.register_guild(event.guild_id)
@@ -372,13 +444,37 @@ class SnedBot(lightbulb.BotApp):
         await self.db.wipe_guild(event.guild_id, keep_record=False)
         logging.info(f"Bot has been removed from guild {event.guild_id}, correlating data erased.")
 
+    def _schedule_db_backup(self) -> None:
+        """Schedule the next daily database backup for DB_BACKUP_TIME.
+
+        The delay is recomputed before every backup, so the backups stay aligned to the wall clock
+        instead of drifting by however long each backup took.
+        """
+        now = helpers.utcnow()
+        next_backup = datetime.datetime.combine(now.date(), DB_BACKUP_TIME)
+        # The event loop's clock may fire slightly early, do not back up twice in the same day
+        if next_backup - now < datetime.timedelta(minutes=1):
+            next_backup += datetime.timedelta(days=1)
+
+        self._db_backup_handle = asyncio.get_running_loop().call_later(
+            (next_backup - now).total_seconds(), self._start_scheduled_backup
+        )
+
+    def _start_scheduled_backup(self) -> None:
+        self._db_backup_handle = None
+        self._db_backup_task = self.create_task(self._scheduled_backup_db())
+
+    async def _scheduled_backup_db(self) -> None:
+        """Run the daily database backup, then schedule the next one."""
+        try:
+            await self.backup_db()
+        except Exception as e:
+            logging.error(f"Scheduled database backup failed: {e}")
+
+        self._schedule_db_backup()
+
     async def backup_db(self) -> None:
         """Backs up the database to a file and, if configured, sends it to the specified channel."""
-        if self.skip_first_db_backup:
-            logging.info("Skipping database backup for this day...")
-            self.skip_first_db_backup = False
-            return
-
         file = await db_backup.backup_database()
         await self.wait_until_started()
 
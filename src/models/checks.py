@@ -1,5 +1,4 @@
 import functools
-import operator
 
 import hikari
 import lightbulb
@@ -20,23 +19,26 @@ async def is_above_target(ctx: SnedContext) -> bool:
     """Check if the targeted user is above the bot's top role or not.
     Used in the moderation extension.
     """
-    if not hasattr(ctx.options, "user"):
+    # Fetch the option once, commands without a user target are always allowed
+    user = getattr(ctx.options, "user", None)
+    if user is None:
         return True
 
     if not ctx.guild_id:
         return True
 
     guild = ctx.get_guild()
-    if guild and guild.owner_id == ctx.options.user.id:
+    if guild and guild.owner_id == user.id:
         raise BotRoleHierarchyError("Cannot execute on the owner of the guild.")
 
+    if user.id == ctx.app.user_id:
+        # The bot's top role can never be above itself, no need to resolve anything
+        raise BotRoleHierarchyError("The targeted user's highest role is higher than the bot's highest role.")
+
     me = ctx.app.cache.get_member(ctx.guild_id, ctx.app.user_id)
     assert me is not None
 
-    if isinstance(ctx.options.user, hikari.Member):
-        member = ctx.options.user
-    else:
-        member = ctx.app.cache.get_member(ctx.guild_id, ctx.options.user)
+    member = user if isinstance(user, hikari.Member) else ctx.app.cache.get_member(ctx.guild_id, user)
 
     if not member:
         return True
@@ -52,7 +54,9 @@ async def is_invoker_above_target(ctx: SnedContext) -> bool:
     """Check if the targeted user is above the invoker's top role or not.
     Used in the moderation extension.
     """
-    if not hasattr(ctx.options, "user"):
+    # Fetch the option once, commands without a user target are always allowed
+    user = getattr(ctx.options, "user", None)
+    if user is None:
         return True
 
     if not ctx.member or not ctx.guild_id:
@@ -64,10 +68,11 @@ async def is_invoker_above_target(ctx: SnedContext) -> bool:
     if ctx.member.id == guild.owner_id:
         return True
 
-    if isinstance(ctx.options.user, hikari.Member):
-        member = ctx.options.user
-    else:
-        member = ctx.app.cache.get_member(ctx.guild_id, ctx.options.user)
+    if user.id == ctx.member.id:
+        # The invoker's top role can never be above itself, no need to resolve anything
+        raise RoleHierarchyError
+
+    member = user if isinstance(user, hikari.Member) else ctx.app.cache.get_member(ctx.guild_id, user)
 
     if not member:
         return True
@@ -78,32 +83,41 @@ async def is_invoker_above_target(ctx: SnedContext) -> bool:
     raise RoleHierarchyError
 
 
+async def _resolve_permissible_channel(
+    ctx: SnedContext,
+) -> tuple[hikari.PermissibleGuildChannel, hikari.GatewayGuild]:
+    """Resolve the channel permissions should be computed in, along with the guild.
+    Threads resolve to their parent channel, as they have no overwrites of their own.
+    """
+    try:
+        channel, guild = (ctx.get_channel() or await ctx.app.rest.fetch_channel(ctx.channel_id)), ctx.get_guild()
+    except hikari.ForbiddenError:
+        raise lightbulb.BotMissingRequiredPermission(
+            "Check cannot run due to missing permissions.", perms=hikari.Permissions.VIEW_CHANNEL
+        )
+
+    if guild is None:
+        raise lightbulb.InsufficientCache("Some objects required for this check could not be resolved from the cache.")
+
+    if isinstance(channel, hikari.GuildThreadChannel):
+        channel = ctx.app.cache.get_guild_channel(channel.parent_id)
+
+    assert isinstance(channel, hikari.PermissibleGuildChannel)
+    return channel, guild
+
+
 async def _has_permissions(ctx: SnedApplicationContext, *, perms: hikari.Permissions) -> bool:
     _guild_only(ctx)
 
     if ctx.interaction is not None and ctx.interaction.member is not None:
         member_perms = ctx.interaction.member.permissions
     else:
-        try:
-            channel, guild = (ctx.get_channel() or await ctx.app.rest.fetch_channel(ctx.channel_id)), ctx.get_guild()
-        except hikari.ForbiddenError:
-            raise lightbulb.BotMissingRequiredPermission(
-                "Check cannot run due to missing permissions.", perms=hikari.Permissions.VIEW_CHANNEL
-            )
+        channel, guild = await _resolve_permissible_channel(ctx)
 
-        if guild is None:
-            raise lightbulb.InsufficientCache(
-                "Some objects required for this check could not be resolved from the cache."
-            )
         if guild.owner_id == ctx.author.id:
             return True
 
         assert ctx.member is not None
-
-        if isinstance(channel, hikari.GuildThreadChannel):
-            channel = ctx.app.cache.get_guild_channel(channel.parent_id)
-
-        assert isinstance(channel, hikari.PermissibleGuildChannel)
         member_perms = lightbulb.utils.permissions_in(channel, ctx.member)
 
     missing_perms = ~member_perms & perms
@@ -122,25 +136,14 @@ async def _bot_has_permissions(ctx: SnedContext, *, perms: hikari.Permissions) -
         bot_perms = interaction.app_permissions
         assert bot_perms is not None
     else:
-        try:
-            channel, guild = (ctx.get_channel() or await ctx.app.rest.fetch_channel(ctx.channel_id)), ctx.get_guild()
-        except hikari.ForbiddenError:
-            raise lightbulb.BotMissingRequiredPermission(
-                "Check cannot run due to missing permissions.", perms=hikari.Permissions.VIEW_CHANNEL
-            )
-        if guild is None:
-            raise lightbulb.InsufficientCache(
-                "Some objects required for this check could not be resolved from the cache."
-            )
+        channel, guild = await _resolve_permissible_channel(ctx)
+
         member = guild.get_my_member()
         if member is None:
             raise lightbulb.InsufficientCache(
                 "Some objects required for this check could not be resolved from the cache."
             )
 
-        if isinstance(channel, hikari.GuildThreadChannel):
-            channel = ctx.app.cache.get_guild_channel(channel.parent_id)
-        assert isinstance(channel, hikari.PermissibleGuildChannel)
         bot_perms = lightbulb.utils.permissions_in(channel, member)
 
     missing_perms = ~bot_perms & perms
@@ -152,15 +155,22 @@ async def _bot_has_permissions(ctx: SnedContext, *, perms: hikari.Permissions) -
     return True
 
 
+def _combine_permissions(perm1: hikari.Permissions, *perms: hikari.Permissions) -> hikari.Permissions:
+    """Combine permissions into a single mask once, when the check is created."""
+    for perm in perms:
+        perm1 |= perm
+    return perm1
+
+
 def has_permissions(perm1: hikari.Permissions, *perms: hikari.Permissions) -> lightbulb.Check:
     """Just a shitty attempt at making has_guild_permissions fetch the channel if it is not present."""
-    reduced = functools.reduce(operator.or_, [perm1, *perms])
+    reduced = _combine_permissions(perm1, *perms)
     return lightbulb.Check(functools.partial(_has_permissions, perms=reduced))
 
 
 def bot_has_permissions(perm1: hikari.Permissions, *perms: hikari.Permissions) -> lightbulb.Check:
     """Just a shitty attempt at making bot_has_guild_permissions fetch the channel if it is not present."""
-    reduced = functools.reduce(operator.or_, [perm1, *perms])
+    reduced = _combine_permissions(perm1, *perms)
     return lightbulb.Check(functools.partial(_bot_has_permissions, perms=reduced))
 
 
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import importlib
 import logging
 import os
+import pathlib
 import typing as t
 from contextlib import asynccontextmanager
 
@@ -30,8 +32,10 @@ class Database:
         self._port = int(os.getenv("POSTGRES_PORT") or 5432)
         self._password = os.environ["POSTGRES_PASSWORD"]
         self._version = os.getenv("POSTGRES_VERSION")
+        self._dsn = f"postgres://{self._user}:{self._password}@{self._host}:{self._port}/{self._db_name}"
         self._pool: asyncpg.Pool | None = None
         self._schema_version: int | None = None
+        self._schema_sql: str | None = None
         self._is_closed: bool = False
 
         DatabaseModel._db = self
@@ -89,14 +93,21 @@ class Database:
     @property
     def dsn(self) -> str:
         """The connection URI used to connect to the database."""
-        return f"postgres://{self.user}:{self.password}@{self.host}:{self.port}/{self.db_name}"
+        return self._dsn
 
     async def connect(self) -> None:
         """Start a new connection and create a connection pool."""
         if self._is_closed:
             raise DatabaseStateConflictError("The database is closed.")
 
-        self._pool = await asyncpg.create_pool(dsn=self.dsn)
+        # Allow bursts of concurrent handlers while letting idle connections go after a while
+        self._pool = await asyncpg.create_pool(
+            dsn=self.dsn,
+            min_size=10,
+            max_size=50,
+            max_inactive_connection_lifetime=300.0,
+            statement_cache_size=1024,
+        )
         await self.build_schema()  # Always check and add missing tables on startup
         self._schema_version = await self.pool.fetchval("""SELECT schema_version FROM schema_info""", column=0)
 
@@ -266,6 +277,25 @@ class Database:
             hikari.Snowflake(guild),
         )
 
+    async def register_guilds(self, guilds: t.Sequence[hikari.SnowflakeishOr[hikari.PartialGuild]]) -> None:
+        """Register multiple guilds in the database in a single query.
+        Guilds that are already registered will be skipped.
+
+        Parameters
+        ----------
+        guilds : t.Sequence[hikari.SnowflakeishOr[hikari.PartialGuild]]
+            The guilds to register.
+
+        Raises
+        ------
+        DatabaseStateConflictError
+            The application is not connected to the database server.
+        """
+        await self.execute(
+            """INSERT INTO global_config (guild_id) SELECT unnest($1::bigint[]) ON CONFLICT (guild_id) DO NOTHING""",
+            [hikari.Snowflake(guild) for guild in guilds],
+        )
+
     async def wipe_guild(self, guild: hikari.SnowflakeishOr[hikari.PartialGuild], *, keep_record: bool = True) -> None:
         """Wipe a guild's data from the database. This will remove all associated data to this guild.
 
@@ -310,8 +340,7 @@ class Database:
         if migration_version <= self.schema_version or not os.path.isfile(path):
             return
 
-        with open(os.path.join(self._app.base_dir, "src", "db", "migrations", filename)) as file:
-            await self.execute(file.read())
+        await self.execute(await asyncio.to_thread(pathlib.Path(path).read_text))
 
         await self._increment_schema_version()
         logger.info(f"Applied database migration: '{filename}'")
@@ -345,19 +374,27 @@ class Database:
         await self._increment_schema_version()
         logger.info(f"Applied database migration: '{filename}'")
 
+    async def _get_schema_sql(self) -> str:
+        """Get the contents of schema.sql, reading it off the event loop only on first use."""
+        if self._schema_sql is None:
+            path = pathlib.Path(self._app.base_dir, "src", "db", "schema.sql")
+            self._schema_sql = await asyncio.to_thread(path.read_text)
+
+        return self._schema_sql
+
     async def build_schema(self) -> None:
         """Build the initial schema for the database if one doesn't already exist."""
+        schema_sql = await self._get_schema_sql()
         async with self.acquire() as con:
-            with open(os.path.join(self._app.base_dir, "src", "db", "schema.sql")) as file:
-                await con.execute(file.read())
+            await con.execute(schema_sql)
 
     async def update_schema(self) -> None:
         """Update the database schema and apply any pending migrations.
         This also creates the initial schema structure if one does not exist.
         """
+        schema_sql = await self._get_schema_sql()
         async with self.acquire() as con:
-            with open(os.path.join(self._app.base_dir, "src", "db", "schema.sql")) as file:
-                await con.execute(file.read())
+            await con.execute(schema_sql)
 
             schema_version = await con.fetchval("""SELECT schema_version FROM schema_info""", column=0)
             if not isinstance(schema_version, int):
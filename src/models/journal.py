@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import datetime
 import enum
+import logging
 import typing as t
 
 import attr
@@ -13,6 +14,8 @@ from src.utils import helpers
 if t.TYPE_CHECKING:
     import asyncpg
 
+logger = logging.getLogger(__name__)
+
 
 class JournalEntryType(enum.IntEnum):
     BAN = 0
@@ -144,6 +147,50 @@ class JournalEntry(DatabaseModel):
         )
         return [cls.from_record(record) for record in records]
 
+    @classmethod
+    async def insert_many(cls, entries: t.Sequence[t.Self]) -> None:
+        """Insert multiple new journal entries into the database in one round-trip.
+
+        The entries will not have their IDs assigned. If the batch fails,
+        the entries are inserted one by one and only the failing ones are discarded.
+
+        Parameters
+        ----------
+        entries : Sequence[JournalEntry]
+            The entries to insert. Entries that already have an ID are ignored.
+        """
+        query = """
+            INSERT INTO journal (user_id, guild_id, content, author_id, created_at, entry_type)
+            VALUES ($1, $2, $3, $4, $5, $6)
+            """
+        args = [
+            (
+                entry.user_id,
+                entry.guild_id,
+                entry.content,
+                entry.author_id,
+                entry.created_at.timestamp(),
+                entry.entry_type.value,
+            )
+            for entry in entries
+            if entry.id is None
+        ]
+        if not args:
+            return
+
+        try:
+            await cls._db.executemany(query, args)
+        except Exception as exc:
+            logger.warning(f"Failed to bulk-insert {len(args)} journal entries, retrying individually: {exc}")
+        else:
+            return
+
+        for arg in args:
+            try:
+                await cls._db.execute(query, *arg)
+            except Exception as exc:
+                logger.error(f"Failed to insert journal entry for user {arg[0]} in guild {arg[1]}: {exc}")
+
     async def update(self) -> None:
         """Update the journal entry in the database.
 
@@ -47,6 +47,13 @@ class SettingsItem(ViewItem):
 class BooleanButton(miru.Button, SettingsItem):
     """A boolean toggle button."""
 
+    # Indexed by the button's state, False first
+    _STYLES: t.ClassVar[tuple[hikari.ButtonStyle, hikari.ButtonStyle]] = (
+        hikari.ButtonStyle.DANGER,
+        hikari.ButtonStyle.SUCCESS,
+    )
+    _EMOJIS: t.ClassVar[tuple[str, str]] = ("✖️", "✔️")
+
     def __init__(
         self,
         *,
@@ -56,19 +63,23 @@ class BooleanButton(miru.Button, SettingsItem):
         row: int | None = None,
         custom_id: str | None = None,
     ) -> None:
-        style = hikari.ButtonStyle.SUCCESS if state else hikari.ButtonStyle.DANGER
-        emoji = "✔️" if state else "✖️"
-
-        self.state = state
-
-        super().__init__(style=style, label=label, emoji=emoji, disabled=disabled, row=row, custom_id=custom_id)
+        self.state = bool(state)
+
+        super().__init__(
+            style=self._STYLES[self.state],
+            label=label,
+            emoji=self._EMOJIS[self.state],
+            disabled=disabled,
+            row=row,
+            custom_id=custom_id,
+        )
 
     async def callback(self, _: miru.ViewContext) -> None:
         self.state = not self.state
         assert self.label is not None
 
-        self.style = hikari.ButtonStyle.SUCCESS if self.state else hikari.ButtonStyle.DANGER
-        self.emoji = "✔️" if self.state else "✖️"
+        self.style = self._STYLES[self.state]
+        self.emoji = self._EMOJIS[self.state]
         self.view.value = SettingValue(boolean=self.state, text=self.label)
         self.view.last_item = self
 
@@ -111,6 +122,15 @@ class OptionsModal(miru.Modal):
 
 
 class PerspectiveBoundsModal(miru.Modal):
+    # (label, custom_id) pairs for each perspective attribute, in display order
+    _FIELDS: t.ClassVar[tuple[tuple[str, str], ...]] = (
+        ("Toxicity", "TOXICITY"),
+        ("Severe Toxicity", "SEVERE_TOXICITY"),
+        ("Threat", "THREAT"),
+        ("Profanity", "PROFANITY"),
+        ("Insult", "INSULT"),
+    )
+
     def __init__(
         self,
         view: miru.View,
@@ -121,56 +141,17 @@ class PerspectiveBoundsModal(miru.Modal):
         timeout: float | None = 300,
     ) -> None:
         super().__init__(title, custom_id=custom_id, timeout=timeout)
-        self.add_item(
-            miru.TextInput(
-                label="Toxicity",
-                placeholder="Enter a floating point value...",
-                custom_id="TOXICITY",
-                value=str(values["TOXICITY"]),
-                min_length=3,
-                max_length=7,
-            )
-        )
-        self.add_item(
-            miru.TextInput(
-                label="Severe Toxicity",
-                placeholder="Enter a floating point value...",
-                custom_id="SEVERE_TOXICITY",
-                value=str(values["SEVERE_TOXICITY"]),
-                min_length=3,
-                max_length=7,
+        for label, field_id in self._FIELDS:
+            self.add_item(
+                miru.TextInput(
+                    label=label,
+                    placeholder="Enter a floating point value...",
+                    custom_id=field_id,
+                    value=str(values[field_id]),
+                    min_length=3,
+                    max_length=7,
+                )
             )
-        )
-        self.add_item(
-            miru.TextInput(
-                label="Threat",
-                placeholder="Enter a floating point value...",
-                custom_id="THREAT",
-                value=str(values["THREAT"]),
-                min_length=3,
-                max_length=7,
-            )
-        )
-        self.add_item(
-            miru.TextInput(
-                label="Profanity",
-                placeholder="Enter a floating point value...",
-                custom_id="PROFANITY",
-                value=str(values["PROFANITY"]),
-                min_length=3,
-                max_length=7,
-            )
-        )
-        self.add_item(
-            miru.TextInput(
-                label="Insult",
-                placeholder="Enter a floating point value...",
-                custom_id="INSULT",
-                value=str(values["INSULT"]),
-                min_length=3,
-                max_length=7,
-            )
-        )
         self.view = view
 
     async def callback(self, context: miru.ModalContext) -> None:
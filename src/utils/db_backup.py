@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import logging
 import os
@@ -16,24 +17,39 @@ async def backup_database() -> hikari.File:
     port: str = os.getenv("POSTGRES_PORT") or "5432"
     db_name: str = os.getenv("POSTGRES_DB") or "sned"
 
-    os.environ["PGPASSWORD"] = password
-
     filepath: str = str(pathlib.Path(os.path.abspath(__file__)).parents[1])
-
-    if not os.path.isdir(os.path.join(filepath, "db", "backup")):
-        os.mkdir(os.path.join(filepath, "db", "backup"))
+    os.makedirs(os.path.join(filepath, "db", "backup"), exist_ok=True)
 
     now = datetime.datetime.now(datetime.timezone.utc)
 
     filename: str = f"{now.year}-{now.month}-{now.day}_{now.hour}_{now.minute}_{now.second}.pgdmp"
     backup_path: str = os.path.join(filepath, "db", "backup", filename)
 
-    return_code = os.system(
-        f"pg_dump -Fc -c -U {username} -d {db_name} -h {hostname} -p {port} --quote-all-identifiers -w > {backup_path}"
-    )
-    os.environ["PGPASSWORD"] = ""
-
-    if return_code != 0:
+    # Run pg_dump as a child process so the event loop is not blocked while it works,
+    # it writes the (already compressed) custom-format dump straight to disk
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "pg_dump",
+            "-Fc",
+            "-c",
+            "-U",
+            username,
+            "-d",
+            db_name,
+            "-h",
+            hostname,
+            "-p",
+            port,
+            "--quote-all-identifiers",
+            "-w",
+            "-f",
+            backup_path,
+            env={**os.environ, "PGPASSWORD": password},
+        )
+    except FileNotFoundError as e:
+        raise RuntimeError("pg_dump was not found, cannot create a database backup file!") from e
+
+    if await process.wait() != 0:
         raise RuntimeError("pg_dump failed to create a database backup file!")
 
     logging.info("Database backup complete!")
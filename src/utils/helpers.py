@@ -27,6 +27,9 @@ LINK_REGEX = re.compile(
 )
 INVITE_REGEX = re.compile(r"(?:https?://)?discord(?:app)?\.(?:com/invite|gg)/[a-zA-Z0-9]+/?")
 
+TIMESTAMP_STYLES = ("t", "T", "d", "D", "f", "F", "R")
+"""Valid styles for Discord timestamps, see format_dt."""
+
 BADGE_EMOJI_MAPPING = {
     hikari.UserFlag.BUG_HUNTER_LEVEL_1: const.EMOJI_BUGHUNTER,
     hikari.UserFlag.BUG_HUNTER_LEVEL_2: const.EMOJI_BUGHUNTER_GOLD,
@@ -47,15 +50,13 @@ def format_dt(time: datetime.datetime, style: str | None = None) -> str:
 
     For styling see this link: https://discord.com/developers/docs/reference#message-formatting-timestamp-styles.
     """
-    valid_styles = ["t", "T", "d", "D", "f", "F", "R"]
-
-    if style and style not in valid_styles:
-        raise ValueError(f"Invalid style passed. Valid styles: {' '.join(valid_styles)}")
+    if not style:
+        return f"<t:{int(time.timestamp())}>"
 
-    if style:
-        return f"<t:{int(time.timestamp())}:{style}>"
+    if style not in TIMESTAMP_STYLES:
+        raise ValueError(f"Invalid style passed. Valid styles: {' '.join(TIMESTAMP_STYLES)}")
 
-    return f"<t:{int(time.timestamp())}>"
+    return f"<t:{int(time.timestamp())}:{style}>"
 
 
 def utcnow() -> datetime.datetime: